@@ -14,13 +14,20 @@ Version: 1.0.0
 """
 
 import os
+import re
 import sys
 import time
+import stat
+import signal
 import asyncio
 import logging
+import string
 import datetime
-import mimetypes
+import concurrent.futures
+import functools
 from pathlib import Path
+from collections import Counter
+from types import MappingProxyType
 from dotenv import load_dotenv
 from telethon import TelegramClient
 from telethon.tl.types import User, Chat, Channel, Dialog
@@ -41,6 +48,8 @@ from rich.box import ROUNDED, DOUBLE, HEAVY, MINIMAL
 from rich.layout import Layout
 from rich.columns import Columns
 from rich.status import Status
+from rich.segment import Segments
+from rich.markup import escape
 from contextlib import asynccontextmanager
 
 # Additional styling
@@ -52,17 +61,20 @@ from termcolor import colored
 # Initialize colorama
 colorama.init(autoreset=True)
 
-# Configure logging - disable Telethon logs to keep the interface clean
-logging.basicConfig(
-    level=logging.WARNING,  # Only show warnings and errors
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+logger = logging.getLogger(__name__)
 
-# Specifically silence Telethon's network logs
-logging.getLogger('telethon').setLevel(logging.ERROR)  # Only show errors
-logging.getLogger('telethon.network').setLevel(logging.ERROR)
 
-logger = logging.getLogger(__name__)
+def configure_logging():
+    """Configure logging - disable Telethon logs to keep the interface clean"""
+    logging.basicConfig(
+        level=logging.WARNING,  # Only show warnings and errors
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Specifically silence Telethon's network logs
+    logging.getLogger('telethon').setLevel(logging.ERROR)  # Only show errors
+    logging.getLogger('telethon.network').setLevel(logging.ERROR)
+
 
 # Create a custom theme for Rich - premium and elegant
 custom_theme = Theme({
@@ -106,6 +118,31 @@ DEFAULT_OUTPUT_FILE = os.getenv('OUTPUT_FILE', 'telegram_chat_export.txt')
 DEFAULT_MESSAGE_LIMIT = int(
     os.getenv('MESSAGE_LIMIT', '0'))  # 0 for all messages
 
+# Number of chats fetched at a time; more can be loaded from the chat list
+DIALOG_PAGE_SIZE = 200
+
+# Buffer size for export files - large enough that big exports need only a
+# handful of write() calls instead of one per 8 KiB
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Encoded export lines are collected into chunks of about this size before
+# each write
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of media files downloaded at the same time
+MEDIA_DOWNLOAD_CONCURRENCY = 6
+
+# Maximum number of media downloads queued or running before fetching pauses
+MEDIA_DOWNLOAD_BACKLOG = MEDIA_DOWNLOAD_CONCURRENCY * 4
+
+# Number of chats whose messages are fetched ahead while exporting several.
+# Each fetched chat is held in memory until it is written, so a batch export
+# keeps up to CHAT_PREFETCH_COUNT + 1 message lists in memory at once.
+CHAT_PREFETCH_COUNT = 3
+
+# Minimum number of seconds between progress status redraws
+STATUS_UPDATE_INTERVAL = 0.1
+
 # Format templates
 FORMAT_TEMPLATES = {
     'whatsapp': {
@@ -186,6 +223,151 @@ FORMAT_TEMPLATES = {
     }
 }
 
+# Templates are read-only so an export can't change them for the rest of
+# the session; the custom format is edited on a copy
+FORMAT_TEMPLATES = MappingProxyType({
+    key: MappingProxyType(template) for key, template in FORMAT_TEMPLATES.items()
+})
+
+# Template used when none is given
+DEFAULT_FORMAT_TEMPLATE = FORMAT_TEMPLATES['whatsapp']
+
+
+@functools.lru_cache(maxsize=None)
+def compile_format(format_string):
+    """Compile a template's format string into a function of a field dict
+
+    The format string is parsed once; the returned function just joins the
+    literal text with the field values, instead of str.format re-parsing
+    the template for every message. Templates using conversions, format
+    specs or indexed fields fall back to str.format_map.
+    """
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(format_string):
+        if literal:
+            parts.append((literal, None))
+        if field is not None:
+            if format_spec or conversion or not field.isidentifier():
+                return format_string.format_map
+            parts.append((None, field))
+
+    def render(fields):
+        return ''.join([literal if field is None else fields[field]
+                        for literal, field in parts])
+
+    return render
+
+
+# Descriptions for service messages, keyed by Telethon action type name
+ACTION_DESCRIPTIONS = {
+    'MessageActionChatCreate': "created this group",
+    'MessageActionChatAddUser': "added a participant to the group",
+    'MessageActionChatDeleteUser': "removed a participant from the group",
+    'MessageActionChatJoinedByLink': "joined the group by link",
+    'MessageActionChatEditPhoto': "changed the group photo",
+    'MessageActionChatDeletePhoto': "removed the group photo",
+    'MessageActionPinMessage': "pinned a message",
+}
+
+# Type column cells by entity class; anything else is shown as a channel.
+# Styled Text cells are used as is, without parsing markup for every row
+ENTITY_TYPE_CELLS = {
+    User: Text.assemble(("👤 User", "user")),
+    Chat: Text.assemble(("👥 Group", "group")),
+}
+CHANNEL_TYPE_CELL = Text.assemble(("📢 Channel", "channel"))
+
+# strftime codes (with optional flags like %-S) that render seconds or
+# microseconds, used to decide how precisely a formatted date must be keyed
+SECOND_FORMAT_CODES = re.compile(r'%[-_0^#EO]*[SsTXcr]')
+MICROSECOND_FORMAT_CODES = re.compile(r'%[-_0^#EO]*f')
+
+
+@functools.lru_cache(maxsize=None)
+def date_precision(date_format):
+    """Return datetime.replace() arguments dropping detail the format doesn't show"""
+    if MICROSECOND_FORMAT_CODES.search(date_format):
+        return {}
+    if SECOND_FORMAT_CODES.search(date_format):
+        return {'microsecond': 0}
+    return {'second': 0, 'microsecond': 0}
+
+
+@functools.lru_cache(maxsize=4096)
+def strftime_cached(date_format, date):
+    """Memoized datetime.strftime
+
+    Callers truncate the date to the precision the format shows, so every
+    message sent within the same minute (or second) shares one entry.
+    """
+    return date.strftime(date_format)
+
+
+class ChatNameCharTable(dict):
+    """str.translate table that keeps letters, digits, spaces, '_' and '-'
+
+    Each character is classified the first time it is seen and remembered,
+    so sanitizing names runs in C after the first few lookups.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' _-' else None
+        self[codepoint] = value
+        return value
+
+
+CHAT_NAME_CHARS = ChatNameCharTable()
+
+
+def sanitize_chat_name(name):
+    """Make a chat name safe to use in file and directory names"""
+    return name.translate(CHAT_NAME_CHARS).strip().replace(' ', '_')
+
+
+# Dates typed at the export prompts (YYYY-MM-DD)
+DATE_INPUT_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+
+def parse_date_input(text):
+    """Parse a YYYY-MM-DD prompt answer into midnight UTC"""
+    match = DATE_INPUT_PATTERN.fullmatch(text)
+    if not match:
+        raise ValueError(f"invalid date: {text!r}")
+    year, month, day = map(int, match.groups())
+    return datetime.datetime(year, month, day, tzinfo=datetime.timezone.utc)
+
+
+def as_utc(date):
+    """Return date as an aware datetime, treating naive dates as UTC"""
+    if date is not None and date.tzinfo is None:
+        return date.replace(tzinfo=datetime.timezone.utc)
+    return date
+
+
+def parse_media_types(text, media_types):
+    """Return the media types named in a comma-separated prompt answer
+
+    Each entry selects the one type it is a prefix of (so 'photo' or 'doc'
+    work), and an empty answer or 'all' selects every type. Entries that
+    match no type, or more than one, raise ValueError.
+    """
+    entries = {entry.strip() for entry in text.lower().split(',')} - {''}
+    if not entries or 'all' in entries:
+        return set(media_types)
+
+    selected = set()
+    for entry in entries:
+        matches = [media_type for media_type in media_types
+                   if media_type.startswith(entry)]
+        if not matches:
+            raise ValueError(f"'{entry}' is not a media type")
+        if len(matches) > 1:
+            raise ValueError(
+                f"'{entry}' could mean {' or '.join(matches)}")
+        selected.add(matches[0])
+    return selected
+
 
 @asynccontextmanager
 async def status_context(message):
@@ -198,6 +380,71 @@ async def status_context(message):
         status.stop()
 
 
+class StatusRelay:
+    """Keep the latest status message until a status display is attached"""
+
+    def __init__(self):
+        self.status = None
+        self.message = None
+
+    def update(self, message):
+        """Show a message now if attached, otherwise keep it for later"""
+        self.message = message
+        if self.status:
+            self.status.update(message)
+
+    def attach(self, status):
+        """Forward updates to a status display, starting with the latest"""
+        self.status = status
+        if self.message:
+            status.update(self.message)
+
+
+def create_logo_panel():
+    """Create the ChatShift logo - elegant and minimal"""
+    # Create a compact, modern header
+    header = Text()
+    header.append("✧ ", style="cyan")
+    header.append("ChatShift", style="bold cyan")
+    header.append(" ✧\n", style="cyan")
+
+    # Add version and description in a single line
+    header.append("v1.0.0 ", style="dim")
+    header.append("• ", style="dim")
+    header.append("Telegram Chat Exporter", style="italic dim")
+
+    # Create a compact panel with the header
+    header_panel = Panel(
+        Align.center(header),
+        box=ROUNDED,
+        border_style="cyan",
+        padding=(1, 3),
+        title="WELCOME",
+        subtitle="by mosaddiX"
+    )
+    return Align.center(header_panel, vertical="middle")
+
+
+# Static panels, built once and reprinted on every redraw
+LOGO_PANEL = create_logo_panel()
+
+AUTH_PANEL = Panel(
+    "[bold]Telegram Authentication[/bold]\n\n"
+    "Connecting to Telegram servers...",
+    title="Authentication",
+    border_style="cyan",
+    box=ROUNDED
+)
+
+FETCH_PANEL = Panel(
+    "[bold]Fetching Your Chats[/bold]\n\n"
+    "Retrieving your Telegram conversations...",
+    title="Chats",
+    border_style="border",
+    box=MINIMAL
+)
+
+
 class ChatShiftCLI:
     """Elegant CLI for ChatShift"""
 
@@ -205,69 +452,62 @@ class ChatShiftCLI:
         """Initialize the CLI"""
         self.client = None
         self.dialogs = []
+
+        # Whether self.dialogs holds every chat or only the first pages
+        self.all_dialogs_loaded = False
         self.spinner_chars = ['⣾', '⣽', '⣻', '⢿', '⡿', '⣟', '⣯', '⣷']
 
+        # Sender names by sender ID, rebuilt for every export
+        self.sender_names = {}
+
+        # Answers to the last export options prompts, offered for reuse
+        self.last_export_options = None
+
+        # Prompts are read by a single worker thread that run() shuts down
+        # on exit, and the read in progress is kept so exit can wait for it
+        self.input_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='chatshift-input')
+        self.pending_input = None
+
+        # Rendered dialogs display and the key of what it shows
+        self.dialogs_display = None
+        self.dialogs_display_key = None
+
     def display_logo(self):
         """Display the ChatShift logo - elegant and minimal"""
         # Clear the screen for a clean start
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-        # Create a compact, modern header
-        header = Text()
-        header.append("✧ ", style="cyan")
-        header.append("ChatShift", style="bold cyan")
-        header.append(" ✧\n", style="cyan")
-
-        # Add version and description in a single line
-        header.append("v1.0.0 ", style="dim")
-        header.append("• ", style="dim")
-        header.append("Telegram Chat Exporter", style="italic dim")
-
-        # Create a compact panel with the header
-        header_panel = Panel(
-            Align.center(header),
-            box=ROUNDED,
-            border_style="cyan",
-            padding=(1, 3),
-            title="WELCOME",
-            subtitle="by mosaddiX"
-        )
+        console.clear()
 
         # Print the header panel
         console.print("\n")
-        console.print(Align.center(header_panel, vertical="middle"))
+        console.print(LOGO_PANEL)
         console.print("\n")
 
     async def authenticate(self):
         """Authenticate with Telegram"""
-        # Create an authentication panel
-        auth_panel = Panel(
-            "[bold]Telegram Authentication[/bold]\n\n"
-            "Connecting to Telegram servers...",
-            title="Authentication",
-            border_style="cyan",
-            box=ROUNDED
-        )
-        console.print(auth_panel)
+        # Show the authentication panel
+        console.print(AUTH_PANEL)
 
         # Create the client
         self.client = TelegramClient('chatshift_session', API_ID, API_HASH)
 
-        # Connect to Telegram with a spinner
-        with console.status("[bold cyan]Connecting to Telegram...[/bold cyan]", spinner="dots") as status:
+        # Connect, check the session and request a code if needed, all
+        # under one spinner that is updated between steps
+        async with status_context("[bold cyan]Connecting to Telegram...[/bold cyan]") as status:
             await self.client.connect()
-            status.update("[bold green]Connected![/bold green]")
-            time.sleep(0.5)
-
-        # Check if already authenticated
-        if not await self.client.is_user_authorized():
-            console.print(f"[bold]Logging in as[/bold] [cyan]{PHONE}[/cyan]")
+            status.update("[bold cyan]Checking session...[/bold cyan]")
+            authorized = await self.client.is_user_authorized()
 
-            # Send code request with a spinner
-            with console.status("[bold cyan]Sending authentication code...[/bold cyan]", spinner="dots") as status:
+            if not authorized:
+                console.print(
+                    f"[bold]Logging in as[/bold] [cyan]{PHONE}[/cyan]")
+                status.update(
+                    "[bold cyan]Sending authentication code...[/bold cyan]")
                 await self.client.send_code_request(PHONE)
-                status.update("[bold green]Code sent![/bold green]")
-                time.sleep(0.5)
+
+        # Check if already authenticated
+        if not authorized:
+            console.print("[bold green]Code sent![/bold green]")
 
             # Ask for the code with a styled prompt
             code = console.input(
@@ -275,11 +515,8 @@ class ChatShiftCLI:
 
             try:
                 # Sign in with the code (with spinner)
-                with console.status("[bold cyan]Verifying code...[/bold cyan]", spinner="dots") as status:
+                async with status_context("[bold cyan]Verifying code...[/bold cyan]"):
                     await self.client.sign_in(PHONE, code)
-                    status.update(
-                        "[bold green]Verification successful![/bold green]")
-                    time.sleep(0.5)
             except Exception as e:
                 console.print(
                     f"[bold red]Error during authentication:[/bold red] {str(e)}")
@@ -290,8 +527,16 @@ class ChatShiftCLI:
             "[bold green]✓ Successfully authenticated with Telegram![/bold green]")
         return True
 
+    async def fetch_dialogs(self, limit):
+        """Fetch the first limit dialogs (chats)"""
+        self.dialogs = await self.client.get_dialogs(limit=limit)
+        self.all_dialogs_loaded = len(self.dialogs) < limit
+
     async def get_dialogs(self, is_refresh=False):
-        """Get all dialogs (chats)"""
+        """Get the most recent dialogs (chats)"""
+        # Fetch one page, or as many chats as were already loaded on refresh
+        limit = max(DIALOG_PAGE_SIZE, len(self.dialogs))
+
         try:
             # If refreshing, use a more subtle status indicator
             if is_refresh:
@@ -302,32 +547,23 @@ class ChatShiftCLI:
                 self.display_logo()
 
                 # Show a status message
-                with console.status("[info]Updating chat list...[/info]", spinner="dots") as status:
+                async with status_context("[info]Updating chat list...[/info]"):
                     # Get dialogs
-                    self.dialogs = await self.client.get_dialogs()
-                    status.update(
-                        f"[success]Updated! Found {len(self.dialogs)} chats[/success]")
-                    time.sleep(0.3)
+                    await self.fetch_dialogs(limit)
+                console.print(
+                    f"[success]Updated! Found {len(self.dialogs)} chats[/success]")
 
                 # Display the updated dialogs table
                 console.print(self.create_dialogs_display())
             else:
                 # First time loading - show a more prominent status
-                # Create a panel for the dialog fetching process
-                fetch_panel = Panel(
-                    "[bold]Fetching Your Chats[/bold]\n\n"
-                    "Retrieving your Telegram conversations...",
-                    title="Chats",
-                    border_style="border",
-                    box=MINIMAL
-                )
-                console.print(fetch_panel)
-
-                with console.status("[info]Retrieving chats from Telegram...[/info]", spinner="dots") as status:
-                    self.dialogs = await self.client.get_dialogs()
-                    status.update(
-                        f"[success]Found {len(self.dialogs)} chats![/success]")
-                    time.sleep(0.5)
+                # Show the panel for the dialog fetching process
+                console.print(FETCH_PANEL)
+
+                async with status_context("[info]Retrieving chats from Telegram...[/info]"):
+                    await self.fetch_dialogs(limit)
+                console.print(
+                    f"[success]Found {len(self.dialogs)} chats![/success]")
 
             return True
         except Exception as e:
@@ -335,6 +571,22 @@ class ChatShiftCLI:
                 f"[danger]Error fetching chats:[/danger] {str(e)}")
             return False
 
+    async def load_more_dialogs(self):
+        """Load the next page of dialogs and show the longer list"""
+        if self.all_dialogs_loaded:
+            console.print("[muted]All chats are already loaded.[/muted]")
+            return
+
+        try:
+            async with status_context("[info]Loading more chats...[/info]"):
+                await self.fetch_dialogs(len(self.dialogs) + DIALOG_PAGE_SIZE)
+        except Exception as e:
+            console.print(
+                f"[danger]Error fetching chats:[/danger] {str(e)}")
+            return
+
+        console.print(self.create_dialogs_display())
+
     def create_dialogs_table(self):
         """Create a table for the dialogs"""
         # Create a premium-looking table for the dialogs
@@ -357,34 +609,17 @@ class ChatShiftCLI:
         table.add_column("Name", width=40)
         table.add_column("Unread", justify="center", width=8)
 
-        # Add rows for each dialog
+        # Add rows for each dialog, looking the type cell up by class
+        add_row = table.add_row
         for i, dialog in enumerate(self.dialogs, 1):
-            entity = dialog.entity
-
-            # Determine entity type and style - using minimal icons for a cleaner look
-            if isinstance(entity, User):
-                entity_type = "👤 User"
-                type_style = "user"
-            elif isinstance(entity, Chat):
-                entity_type = "👥 Group"
-                type_style = "group"
-            else:
-                entity_type = "📢 Channel"
-                type_style = "channel"
+            type_cell = ENTITY_TYPE_CELLS.get(
+                type(dialog.entity), CHANNEL_TYPE_CELL)
 
             # Format unread count
-            if dialog.unread_count > 0:
-                unread = f"[unread]{dialog.unread_count}[/unread]"
-            else:
-                unread = "0"
-
-            # Add row to table with elegant styling
-            table.add_row(
-                str(i),
-                f"[{type_style}]{entity_type}[/{type_style}]",
-                dialog.name,
-                unread
-            )
+            unread_count = dialog.unread_count
+            unread = Text.assemble((str(unread_count), "unread")) if unread_count > 0 else Text("0")
+
+            add_row(Text(str(i)), type_cell, Text(dialog.name), unread)
 
         return table
 
@@ -396,13 +631,26 @@ class ChatShiftCLI:
         help_text.append("number", style="accent")
         help_text.append(" to select a chat, ", style="muted")
         help_text.append("r", style="accent")
-        help_text.append(" to refresh, or ", style="muted")
+        if not self.all_dialogs_loaded:
+            help_text.append(" to refresh, ", style="muted")
+            help_text.append("m", style="accent")
+            help_text.append(" to load more chats, or ", style="muted")
+        else:
+            help_text.append(" to refresh, or ", style="muted")
         help_text.append("q", style="accent")
         help_text.append(" to quit", style="muted")
         return Align.center(help_text)
 
     def create_dialogs_display(self):
         """Create the complete dialogs display with table and help text"""
+        # Reuse the last display unless something it shows has changed,
+        # so refreshing an unchanged chat list doesn't lay the table out again
+        key = (console.width, self.all_dialogs_loaded,
+               tuple((type(dialog.entity), dialog.name, dialog.unread_count)
+                     for dialog in self.dialogs))
+        if key == self.dialogs_display_key:
+            return self.dialogs_display
+
         # Create a panel to wrap the table
         panel = Panel(
             self.create_dialogs_table(),
@@ -412,8 +660,35 @@ class ChatShiftCLI:
             padding=(0, 1)
         )
 
-        # Create a group with the panel and help text
-        return Group(panel, self.create_help_text())
+        # Create a group with the panel and help text, keeping its rendered
+        # lines so printing it again is just writing them out
+        display = Group(panel, self.create_help_text())
+        self.dialogs_display = Segments(console.render(display))
+        self.dialogs_display_key = key
+        return self.dialogs_display
+
+    async def ask(self, prompt):
+        """Read a line from the user without blocking the event loop"""
+        # A read cut short by Ctrl+C is still waiting for its line, so show
+        # the new prompt and let that read answer it
+        if self.pending_input and not self.pending_input.done():
+            console.print(prompt, end='')
+        else:
+            self.pending_input = self.input_executor.submit(
+                console.input, prompt)
+        return await asyncio.wrap_future(self.pending_input)
+
+    def close_input(self):
+        """Stop the prompt reader"""
+        # A thread blocked reading stdin can't be interrupted and would keep
+        # the interpreter from exiting until Enter is pressed, so leave
+        # without waiting for it
+        if self.pending_input and not self.pending_input.done():
+            logging.shutdown()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)
+        self.input_executor.shutdown(wait=True)
 
     def display_dialogs(self):
         """Display all dialogs in a numbered list"""
@@ -421,14 +696,14 @@ class ChatShiftCLI:
         display = self.create_dialogs_display()
         console.print(display)
 
-    def select_dialog(self, multiple=False):
+    async def select_dialog(self, multiple=False):
         """Let the user select a dialog or multiple dialogs"""
         if not multiple:
             # Single dialog selection
             while True:
                 try:
                     # Styled input prompt with minimal design
-                    choice = console.input("\n[bold]>[/bold] ")
+                    choice = await self.ask("\n[bold]>[/bold] ")
 
                     if choice.lower() == 'q':
                         console.print("[muted]Exiting...[/muted]")
@@ -437,6 +712,9 @@ class ChatShiftCLI:
                         # Clear the screen first to avoid duplicate display
                         console.print("[muted]Refreshing chats...[/muted]")
                         return 'refresh'
+                    elif choice.lower() == 'm':
+                        await self.load_more_dialogs()
+                        continue
 
                     choice = int(choice)
                     if 1 <= choice <= len(self.dialogs):
@@ -459,14 +737,22 @@ class ChatShiftCLI:
         else:
             # Multiple dialog selection
             selected_dialogs = []
-            selected_indices = set()
+            selected_ids = set()
 
-            console.print("\n[info]Multiple chat selection mode:[/info]")
-            console.print("- Enter a number to select a chat")
-            console.print("- Enter 'd' when you're done selecting")
-            console.print("- Enter 'v' to view all selected chats")
-            console.print("- Enter 'r' to refresh the chat list")
-            console.print("- Enter 'q' to quit")
+            # Table shown by 'v', built on first use and then extended as
+            # chats are added instead of being rebuilt on every view
+            selected_table = None
+
+            # Print the commands in one go
+            load_more_help = "" if self.all_dialogs_loaded else "- Enter 'm' to load more chats\n"
+            console.print(
+                "\n[info]Multiple chat selection mode:[/info]\n"
+                "- Enter a number to select a chat\n"
+                "- Enter 'd' when you're done selecting\n"
+                "- Enter 'v' to view all selected chats\n"
+                "- Enter 'r' to refresh the chat list\n"
+                f"{load_more_help}"
+                "- Enter 'q' to quit")
 
             while True:
                 try:
@@ -477,7 +763,7 @@ class ChatShiftCLI:
                     prompt = "\n[bold]>[/bold] "
                     if selected_dialogs:
                         prompt = f"\n[bold]Selected: [accent]{len(selected_dialogs)}[/accent] >[/bold] "
-                    choice = console.input(prompt)
+                    choice = await self.ask(prompt)
 
                     if choice.lower() == 'q':
                         console.print("[muted]Exiting...[/muted]")
@@ -485,18 +771,23 @@ class ChatShiftCLI:
                     elif choice.lower() == 'r':
                         console.print("[muted]Refreshing chats...[/muted]")
                         return 'refresh'
+                    elif choice.lower() == 'm':
+                        await self.load_more_dialogs()
+                        continue
                     elif choice.lower() == 'v':
                         # Show all selected chats in a table
                         if selected_dialogs:
-                            table = Table(
-                                title=f"All Selected Chats ({len(selected_dialogs)})")
-                            table.add_column("#", style="dim")
-                            table.add_column("Chat Name", style="cyan")
+                            if selected_table is None:
+                                selected_table = Table()
+                                selected_table.add_column("#", style="dim")
+                                selected_table.add_column(
+                                    "Chat Name", style="cyan")
 
-                            for i, dialog in enumerate(selected_dialogs, 1):
-                                table.add_row(str(i), dialog.name)
+                                for i, dialog in enumerate(selected_dialogs, 1):
+                                    selected_table.add_row(str(i), dialog.name)
 
-                            console.print(table)
+                            selected_table.title = f"All Selected Chats ({len(selected_dialogs)})"
+                            console.print(selected_table)
                         continue
                     elif choice.lower() == 'd':
                         if selected_dialogs:
@@ -516,13 +807,18 @@ class ChatShiftCLI:
 
                     choice = int(choice)
                     if 1 <= choice <= len(self.dialogs):
-                        if choice - 1 in selected_indices:
+                        # Chats are tracked by ID since loading more can
+                        # shift their positions in the list
+                        selected = self.dialogs[choice - 1]
+                        if selected.id in selected_ids:
                             console.print(
                                 "[warning]This chat is already selected.[/warning]")
                         else:
-                            selected = self.dialogs[choice - 1]
                             selected_dialogs.append(selected)
-                            selected_indices.add(choice - 1)
+                            selected_ids.add(selected.id)
+                            if selected_table is not None:
+                                selected_table.add_row(
+                                    str(len(selected_dialogs)), selected.name)
 
                             # Show a confirmation for the newly added chat only
                             console.print(
@@ -540,7 +836,7 @@ class ChatShiftCLI:
                         console.print(
                             "[warning]Please enter a valid number or command.[/warning]")
 
-    def get_export_options(self):
+    async def get_export_options(self):
         """Get export options from the user"""
         # Create a panel for export options
         export_panel = Panel(
@@ -551,11 +847,28 @@ class ChatShiftCLI:
         )
         console.print(export_panel)
 
+        # Offer the previous answers, so a repeat export takes one prompt
+        if self.last_export_options:
+            reuse = await self.ask(
+                "[bold]Use the same options as the last export?[/bold] (y/n, default: n): ")
+            if reuse.lower() == 'y':
+                # Only the content options are reused; the output file is
+                # asked again so another chat's export isn't overwritten
+                options = dict(self.last_export_options)
+                limit = options['limit']
+                console.print(
+                    "[dim]→ Using the previous limit, date range, media types and format:[/dim] "
+                    f"[cyan]{'all messages' if limit == 0 else f'up to {limit} messages'}, "
+                    f"{options['format_template']['name']} format[/cyan]")
+                options.update(await self.get_output_options())
+                self.last_export_options = dict(options)
+                return options
+
         # Get message limit with validation
         while True:
             try:
                 # Styled input for message limit
-                limit_input = console.input(
+                limit_input = await self.ask(
                     f"[bold]Message limit[/bold] [dim](default: {DEFAULT_MESSAGE_LIMIT} = all messages):[/dim] ")
                 limit = int(
                     limit_input) if limit_input else DEFAULT_MESSAGE_LIMIT
@@ -578,15 +891,15 @@ class ChatShiftCLI:
                     "[bold yellow]Please enter a valid number.[/bold yellow]")
 
         # Ask if user wants to filter by date range
-        use_date_filter = console.input(
-            "\n[bold]Filter by date range?[/bold] (y/n, default: n): ").lower() == 'y'
+        use_date_filter = (await self.ask(
+            "\n[bold]Filter by date range?[/bold] (y/n, default: n): ")).lower() == 'y'
 
         start_date = None
         end_date = None
 
         # Ask if user wants to filter media types
-        use_media_filter = console.input(
-            "\n[bold]Filter media types?[/bold] (y/n, default: n): ").lower() == 'y'
+        use_media_filter = (await self.ask(
+            "\n[bold]Filter media types?[/bold] (y/n, default: n): ")).lower() == 'y'
 
         # Default to including all media types
         include_photos = True
@@ -610,33 +923,32 @@ class ChatShiftCLI:
             )
             console.print(media_panel)
 
-            # Ask for each media type
-            include_photos = console.input(
-                "\n[bold]Include photos?[/bold] (y/n, default: y): ").lower() != 'n'
-            include_videos = console.input(
-                "[bold]Include videos?[/bold] (y/n, default: y): ").lower() != 'n'
-            include_documents = console.input(
-                "[bold]Include documents?[/bold] (y/n, default: y): ").lower() != 'n'
-            include_audio = console.input(
-                "[bold]Include audio files?[/bold] (y/n, default: y): ").lower() != 'n'
-            include_stickers = console.input(
-                "[bold]Include stickers?[/bold] (y/n, default: y): ").lower() != 'n'
-            include_voice = console.input(
-                "[bold]Include voice messages?[/bold] (y/n, default: y): ").lower() != 'n'
+            # Ask for all media types at once, with validation
+            while True:
+                try:
+                    media_types = parse_media_types(await self.ask(
+                        "\n[bold]Media types to include[/bold] (comma-separated: photos, videos, "
+                        "documents, audio, stickers, voice; default: all): "),
+                        ('photos', 'videos', 'documents', 'audio', 'stickers', 'voice'))
+                    break
+                except ValueError as e:
+                    console.print(
+                        f"[bold yellow]{escape(str(e))}. Please enter types from the list.[/bold yellow]")
+            include_photos = 'photos' in media_types
+            include_videos = 'videos' in media_types
+            include_documents = 'documents' in media_types
+            include_audio = 'audio' in media_types
+            include_stickers = 'stickers' in media_types
+            include_voice = 'voice' in media_types
 
             # Show summary of selected options
-            console.print("\n[bold]Media types to include:[/bold]")
-            console.print(
-                f"[dim]→ Photos:[/dim] [cyan]{'Yes' if include_photos else 'No'}[/cyan]")
-            console.print(
-                f"[dim]→ Videos:[/dim] [cyan]{'Yes' if include_videos else 'No'}[/cyan]")
-            console.print(
-                f"[dim]→ Documents:[/dim] [cyan]{'Yes' if include_documents else 'No'}[/cyan]")
-            console.print(
-                f"[dim]→ Audio:[/dim] [cyan]{'Yes' if include_audio else 'No'}[/cyan]")
-            console.print(
-                f"[dim]→ Stickers:[/dim] [cyan]{'Yes' if include_stickers else 'No'}[/cyan]")
             console.print(
+                "\n[bold]Media types to include:[/bold]\n"
+                f"[dim]→ Photos:[/dim] [cyan]{'Yes' if include_photos else 'No'}[/cyan]\n"
+                f"[dim]→ Videos:[/dim] [cyan]{'Yes' if include_videos else 'No'}[/cyan]\n"
+                f"[dim]→ Documents:[/dim] [cyan]{'Yes' if include_documents else 'No'}[/cyan]\n"
+                f"[dim]→ Audio:[/dim] [cyan]{'Yes' if include_audio else 'No'}[/cyan]\n"
+                f"[dim]→ Stickers:[/dim] [cyan]{'Yes' if include_stickers else 'No'}[/cyan]\n"
                 f"[dim]→ Voice messages:[/dim] [cyan]{'Yes' if include_voice else 'No'}[/cyan]")
 
         # No message type filtering UI - all message types are included by default
@@ -645,7 +957,7 @@ class ChatShiftCLI:
             # Get start date with validation
             while True:
                 try:
-                    start_date_input = console.input(
+                    start_date_input = await self.ask(
                         "[bold]Start date[/bold] [dim](YYYY-MM-DD, leave empty for no start date):[/dim] ")
 
                     if not start_date_input:
@@ -653,11 +965,7 @@ class ChatShiftCLI:
                         break
 
                     # Parse and validate the date
-                    start_date = datetime.datetime.strptime(
-                        start_date_input, "%Y-%m-%d")
-                    # Make timezone-aware by setting to UTC
-                    start_date = start_date.replace(
-                        tzinfo=datetime.timezone.utc)
+                    start_date = parse_date_input(start_date_input)
                     console.print(
                         f"[dim]→ Start date:[/dim] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
                     break
@@ -668,7 +976,7 @@ class ChatShiftCLI:
             # Get end date with validation
             while True:
                 try:
-                    end_date_input = console.input(
+                    end_date_input = await self.ask(
                         "[bold]End date[/bold] [dim](YYYY-MM-DD, leave empty for no end date):[/dim] ")
 
                     if not end_date_input:
@@ -676,15 +984,11 @@ class ChatShiftCLI:
                         break
 
                     # Parse and validate the date
-                    end_date = datetime.datetime.strptime(
-                        end_date_input, "%Y-%m-%d")
+                    end_date = parse_date_input(end_date_input)
 
                     # Add one day to end date to include the entire day
                     end_date = end_date + datetime.timedelta(days=1)
 
-                    # Make timezone-aware by setting to UTC
-                    end_date = end_date.replace(tzinfo=datetime.timezone.utc)
-
                     console.print(
                         f"[dim]→ End date:[/dim] [cyan]{end_date_input}[/cyan]")
 
@@ -700,79 +1004,8 @@ class ChatShiftCLI:
                     console.print(
                         "[bold yellow]Please enter a valid date in YYYY-MM-DD format.[/bold yellow]")
 
-        # Ask for file naming options
-        use_custom_naming = console.input(
-            "\n[bold]Use custom file naming options?[/bold] (y/n, default: n): ").lower() == 'y'
-
-        file_pattern = ""
-        file_extension = ""
-        custom_name_info = ""
-
-        if use_custom_naming:
-            # Create a panel for file naming options
-            file_panel = Panel(
-                "[bold]File Naming Options[/bold]\n\n"
-                "Customize how your exported file will be named.",
-                title="File Options",
-                border_style="cyan",
-                box=ROUNDED
-            )
-            console.print(file_panel)
-
-            # Ask for file name pattern
-            console.print("\n[bold]Available placeholders:[/bold]")
-            console.print("[dim]{chat_name}[/dim] - Name of the chat")
-            console.print("[dim]{date}[/dim] - Current date (YYYY-MM-DD)")
-            console.print("[dim]{time}[/dim] - Current time (HHMM)")
-
-            # Default pattern
-            default_pattern = "{chat_name}_{date}"
-
-            # Get custom pattern
-            file_pattern = console.input(
-                f"\n[bold]File name pattern[/bold] [dim](default: {default_pattern}):[/dim] ")
-
-            if not file_pattern:
-                file_pattern = default_pattern
-
-            # Get file extension
-            extension_input = console.input(
-                "\n[bold]File extension[/bold] [dim](default: txt):[/dim] ")
-
-            if not extension_input:
-                file_extension = ".txt"
-            elif not extension_input.startswith("."):
-                file_extension = "." + extension_input
-            else:
-                file_extension = extension_input
-
-            # Generate output file name based on pattern
-            current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-            current_time = datetime.datetime.now().strftime("%H%M")
-
-            # We'll replace {chat_name} later when we have the selected dialog
-            output_file = file_pattern.replace(
-                "{date}", current_date).replace("{time}", current_time)
-
-            # Store the pattern for later use
-            custom_name_info = file_pattern + file_extension
-
-            # For now, use a temporary name - we'll update it when we know the chat name
-            output_file = output_file.replace(
-                "{chat_name}", "CHAT") + file_extension
-
-            console.print(
-                f"[dim]→ File name pattern:[/dim] [cyan]{custom_name_info}[/cyan]")
-        else:
-            # Get output file with styled input (traditional way)
-            output_file = console.input(
-                f"\n[bold]Output file[/bold] [dim](default: {DEFAULT_OUTPUT_FILE}):[/dim] ")
-
-            if not output_file:
-                output_file = DEFAULT_OUTPUT_FILE
-
-        # Show confirmation of the output file
-        console.print(f"[dim]→ Will save to[/dim] [cyan]{output_file}[/cyan]")
+        # Ask where to save the export
+        output_options = await self.get_output_options()
 
         # Ask for format customization
         format_panel = Panel(
@@ -791,7 +1024,7 @@ class ChatShiftCLI:
                 f"[dim]{i}.[/dim] [cyan]{template['name']}[/cyan] - {template['description']}")
 
         # Ask user to select a format
-        format_choice = console.input(
+        format_choice = await self.ask(
             "\n[bold]Select a format (1-{}):[/bold] ".format(len(FORMAT_TEMPLATES)))
 
         # Default to WhatsApp format if invalid choice
@@ -815,55 +1048,55 @@ class ChatShiftCLI:
 
         # If custom format is selected, allow customization
         if format_key == 'custom':
+            format_template = dict(format_template)
             console.print("\n[bold]Custom Format Options:[/bold]")
 
             # Date format
-            date_format = console.input(
+            date_format = await self.ask(
                 f"[bold]Date format:[/bold] (default: {format_template['date_format']}): ") or format_template['date_format']
             format_template['date_format'] = date_format
 
             # Message format
-            message_format = console.input(
+            message_format = await self.ask(
                 f"[bold]Message format:[/bold] (default: {format_template['message_format']}): ") or format_template['message_format']
             format_template['message_format'] = message_format
 
             # Header format
-            header_format = console.input(
+            header_format = await self.ask(
                 f"[bold]Header format:[/bold] (default: {format_template['header_format']}): ") or format_template['header_format']
             format_template['header_format'] = header_format
 
             # Include header option
-            include_header_choice = console.input(
+            include_header_choice = await self.ask(
                 f"[bold]Include header?[/bold] (y/n, default: {'y' if format_template['include_header'] else 'n'}): ")
             if include_header_choice.lower() in ['y', 'yes', 'n', 'no']:
                 format_template['include_header'] = include_header_choice.lower() in [
                     'y', 'yes']
 
             # Media placeholder
-            media_placeholder = console.input(
+            media_placeholder = await self.ask(
                 f"[bold]Media placeholder:[/bold] (default: {format_template['media_placeholder']}): ") or format_template['media_placeholder']
             format_template['media_placeholder'] = media_placeholder
 
             # Unknown message placeholder
-            unknown_message_placeholder = console.input(
+            unknown_message_placeholder = await self.ask(
                 f"[bold]Unknown message placeholder:[/bold] (default: {format_template['unknown_message_placeholder']}): ") or format_template['unknown_message_placeholder']
             format_template['unknown_message_placeholder'] = unknown_message_placeholder
 
             # Error placeholder
-            error_placeholder = console.input(
+            error_placeholder = await self.ask(
                 f"[bold]Error placeholder:[/bold] (default: {format_template['error_placeholder']}): ") or format_template['error_placeholder']
             format_template['error_placeholder'] = error_placeholder
 
             # Edited suffix
-            edited_suffix = console.input(
+            edited_suffix = await self.ask(
                 f"[bold]Edited suffix:[/bold] (default: {format_template['edited_suffix']}): ") or format_template['edited_suffix']
             format_template['edited_suffix'] = edited_suffix
 
             console.print("[success]Custom format configured![/success]")
 
-        return {
+        options = {
             'limit': limit,
-            'output_file': output_file,
             'start_date': start_date,
             'end_date': end_date,
             'include_photos': include_photos,
@@ -872,11 +1105,197 @@ class ChatShiftCLI:
             'include_audio': include_audio,
             'include_stickers': include_stickers,
             'include_voice': include_voice,
+            'format_template': format_template,
+            **output_options
+        }
+
+        # Remember the answers so the next export can reuse them
+        self.last_export_options = dict(options)
+        return options
+
+    async def get_output_options(self):
+        """Ask for the output file name or naming pattern"""
+        # Ask for file naming options
+        use_custom_naming = (await self.ask(
+            "\n[bold]Use custom file naming options?[/bold] (y/n, default: n): ")).lower() == 'y'
+
+        file_pattern = ""
+        file_extension = ""
+        custom_name_info = ""
+
+        if use_custom_naming:
+            # Create a panel for file naming options
+            file_panel = Panel(
+                "[bold]File Naming Options[/bold]\n\n"
+                "Customize how your exported file will be named.",
+                title="File Options",
+                border_style="cyan",
+                box=ROUNDED
+            )
+            console.print(file_panel)
+
+            # Ask for file name pattern
+            console.print("\n[bold]Available placeholders:[/bold]")
+            console.print("[dim]{chat_name}[/dim] - Name of the chat")
+            console.print("[dim]{date}[/dim] - Current date (YYYY-MM-DD)")
+            console.print("[dim]{time}[/dim] - Current time (HHMM)")
+
+            # Default pattern
+            default_pattern = "{chat_name}_{date}"
+
+            # Get custom pattern
+            file_pattern = await self.ask(
+                f"\n[bold]File name pattern[/bold] [dim](default: {default_pattern}):[/dim] ")
+
+            if not file_pattern:
+                file_pattern = default_pattern
+
+            # Get file extension
+            extension_input = await self.ask(
+                "\n[bold]File extension[/bold] [dim](default: txt):[/dim] ")
+
+            if not extension_input:
+                file_extension = ".txt"
+            elif not extension_input.startswith("."):
+                file_extension = "." + extension_input
+            else:
+                file_extension = extension_input
+
+            # Generate output file name based on pattern
+            now = datetime.datetime.now()
+            current_date = now.strftime("%Y-%m-%d")
+            current_time = now.strftime("%H%M")
+
+            # We'll replace {chat_name} later when we have the selected dialog
+            output_file = file_pattern.replace(
+                "{date}", current_date).replace("{time}", current_time)
+
+            # Store the pattern for later use
+            custom_name_info = file_pattern + file_extension
+
+            # For now, use a temporary name - we'll update it when we know the chat name
+            output_file = output_file.replace(
+                "{chat_name}", "CHAT") + file_extension
+
+            console.print(
+                f"[dim]→ File name pattern:[/dim] [cyan]{custom_name_info}[/cyan]")
+        else:
+            # Get output file with styled input (traditional way)
+            output_file = await self.ask(
+                f"\n[bold]Output file[/bold] [dim](default: {DEFAULT_OUTPUT_FILE}):[/dim] ")
+
+            if not output_file:
+                output_file = DEFAULT_OUTPUT_FILE
+
+        # Show confirmation of the output file
+        console.print(f"[dim]→ Will save to[/dim] [cyan]{output_file}[/cyan]")
+
+        return {
+            'output_file': output_file,
             'use_custom_naming': use_custom_naming,
             'file_pattern': file_pattern,
             'file_extension': file_extension,
-            'custom_name_info': custom_name_info,
-            'format_template': format_template
+            'custom_name_info': custom_name_info
+        }
+
+    def create_date_range_details(self, start_date, end_date):
+        """Create the date range lines for the export and download panels"""
+        details = []
+        if start_date:
+            details.append(
+                f"[bold]Start Date:[/bold] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
+        if end_date:
+            # The end date is exclusive, so show the last included day
+            details.append(
+                f"[bold]End Date:[/bold] [cyan]{(end_date - datetime.timedelta(days=1)).strftime('%Y-%m-%d')}[/cyan]")
+        return details
+
+    def compute_export_statistics(self, messages):
+        """Count message types, media types and senders of a non-empty message list"""
+        # Count message types, media types and senders in a single pass,
+        # looking each attribute up once per message
+        total_messages = len(messages)
+        text_messages = media_messages = service_messages = edited_messages = 0
+        photos = videos = documents = audio = 0
+        senders = Counter()
+        first_date = last_date = None
+
+        # Sender names by sender ID, so each name is built once per sender
+        sender_names = {}
+
+        for m in messages:
+            media = getattr(m, 'media', None)
+            if media:
+                media_messages += 1
+
+                # Count media types
+                if getattr(media, 'photo', None):
+                    photos += 1
+                document = getattr(media, 'document', None)
+                if document:
+                    mime_type = document.mime_type
+                    if not mime_type:
+                        documents += 1
+                    elif mime_type.startswith('video/'):
+                        videos += 1
+                    elif mime_type.startswith('audio/'):
+                        audio += 1
+                    else:
+                        documents += 1
+            elif getattr(m, 'text', None):
+                text_messages += 1
+
+            if getattr(m, 'action', None):
+                service_messages += 1
+            if getattr(m, 'edit_date', None):
+                edited_messages += 1
+
+            # Count messages by sender
+            sender = getattr(m, 'sender', None)
+            if sender:
+                sender_id = getattr(m, 'sender_id', None)
+                if sender_id in sender_names:
+                    sender_name = sender_names[sender_id]
+                else:
+                    sender_name = getattr(sender, 'first_name', getattr(
+                        sender, 'title', 'Unknown'))
+                    last_name = getattr(sender, 'last_name', None)
+                    if last_name:
+                        sender_name += f" {last_name}"
+
+                    # Only cache names of senders we could identify
+                    if sender_id is not None:
+                        sender_names[sender_id] = sender_name
+
+                senders[sender_name] += 1
+
+            # Track the date range
+            date = m.date
+            if first_date is None or date < first_date:
+                first_date = date
+            if last_date is None or date > last_date:
+                last_date = date
+
+        # Get date range
+        date_range = (last_date - first_date).days + 1
+        messages_per_day = total_messages / \
+            date_range if date_range > 0 else total_messages
+
+        return {
+            'total_messages': total_messages,
+            'text_messages': text_messages,
+            'media_messages': media_messages,
+            'service_messages': service_messages,
+            'edited_messages': edited_messages,
+            'photos': photos,
+            'videos': videos,
+            'documents': documents,
+            'audio': audio,
+            'first_date': first_date,
+            'last_date': last_date,
+            'date_range': date_range,
+            'messages_per_day': messages_per_day,
+            'senders': senders
         }
 
     async def generate_export_statistics(self, messages, dialog, output_file=None):
@@ -886,49 +1305,39 @@ class ChatShiftCLI:
                 "[warning]No messages to generate statistics for.[/warning]")
             return None
 
-        # Count message types
-        total_messages = len(messages)
-        text_messages = sum(1 for m in messages if hasattr(
-            m, 'text') and m.text and not m.media)
-        media_messages = sum(
-            1 for m in messages if hasattr(m, 'media') and m.media)
-        service_messages = sum(
-            1 for m in messages if hasattr(m, 'action') and m.action)
-        edited_messages = sum(1 for m in messages if hasattr(
-            m, 'edit_date') and m.edit_date)
-
-        # Count media types
-        photos = sum(1 for m in messages if hasattr(m, 'media')
-                     and m.media and hasattr(m.media, 'photo') and m.media.photo)
-        videos = sum(1 for m in messages if hasattr(m, 'media') and m.media and hasattr(m.media, 'document')
-                     and m.media.document and m.media.document.mime_type and m.media.document.mime_type.startswith('video/'))
-        documents = sum(1 for m in messages if hasattr(m, 'media') and m.media and hasattr(m.media, 'document') and m.media.document and (
-            not m.media.document.mime_type or not (m.media.document.mime_type.startswith('video/') or m.media.document.mime_type.startswith('audio/'))))
-        audio = sum(1 for m in messages if hasattr(m, 'media') and m.media and hasattr(m.media, 'document')
-                    and m.media.document and m.media.document.mime_type and m.media.document.mime_type.startswith('audio/'))
-
-        # Count messages by sender
-        senders = {}
-        for message in messages:
-            if hasattr(message, 'sender') and message.sender:
-                sender_name = getattr(message.sender, 'first_name', getattr(
-                    message.sender, 'title', 'Unknown'))
-                if hasattr(message.sender, 'last_name') and message.sender.last_name:
-                    sender_name += f" {message.sender.last_name}"
-
-                senders[sender_name] = senders.get(sender_name, 0) + 1
-
-        # Get date range
-        if messages:
-            first_date = min(m.date for m in messages)
-            last_date = max(m.date for m in messages)
-            date_range = (last_date - first_date).days + 1
-            messages_per_day = total_messages / \
-                date_range if date_range > 0 else total_messages
-        else:
-            first_date = last_date = datetime.datetime.now()
-            date_range = 0
-            messages_per_day = 0
+        # Counting touches every message, so it runs in a worker thread to
+        # keep the event loop (and Telethon's connection) responsive
+        stats = await asyncio.get_running_loop().run_in_executor(
+            None, self.compute_export_statistics, messages)
+        total_messages = stats['total_messages']
+        text_messages = stats['text_messages']
+        media_messages = stats['media_messages']
+        service_messages = stats['service_messages']
+        edited_messages = stats['edited_messages']
+        photos = stats['photos']
+        videos = stats['videos']
+        documents = stats['documents']
+        audio = stats['audio']
+        first_date = stats['first_date']
+        last_date = stats['last_date']
+        date_range = stats['date_range']
+        messages_per_day = stats['messages_per_day']
+        senders = stats['senders']
+
+        # Format each count with its share once, for both the table and the
+        # statistics file
+        def with_share(count):
+            return f"{count} ({count/total_messages*100:.1f}%)"
+
+        text_summary = with_share(text_messages)
+        media_summary = with_share(media_messages)
+        service_summary = with_share(service_messages)
+        edited_summary = with_share(edited_messages)
+        date_range_summary = f"{first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')} ({date_range} days)"
+
+        # Top 10 senders with their share of the messages
+        top_senders = [(sender, count, f"{count/total_messages*100:.1f}%")
+                       for sender, count in senders.most_common(10)]
 
         # Create statistics table
         table = Table(title=f"Chat Statistics: {dialog.name}")
@@ -937,38 +1346,29 @@ class ChatShiftCLI:
 
         # Add rows
         table.add_row("Total Messages", str(total_messages))
-        table.add_row(
-            "Text Messages", f"{text_messages} ({text_messages/total_messages*100:.1f}%)")
-        table.add_row(
-            "Media Messages", f"{media_messages} ({media_messages/total_messages*100:.1f}%)")
-        table.add_row("Service Messages",
-                      f"{service_messages} ({service_messages/total_messages*100:.1f}%)")
-        table.add_row(
-            "Edited Messages", f"{edited_messages} ({edited_messages/total_messages*100:.1f}%)")
+        table.add_row("Text Messages", text_summary)
+        table.add_row("Media Messages", media_summary)
+        table.add_row("Service Messages", service_summary)
+        table.add_row("Edited Messages", edited_summary)
         table.add_row("Photos", str(photos))
         table.add_row("Videos", str(videos))
         table.add_row("Documents", str(documents))
         table.add_row("Audio Files", str(audio))
-        table.add_row(
-            "Date Range", f"{first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')} ({date_range} days)")
+        table.add_row("Date Range", date_range_summary)
         table.add_row("Messages per Day", f"{messages_per_day:.1f}")
 
         # Display the table
         console.print(table)
 
         # Create top senders table
-        if senders:
-            top_senders = sorted(senders.items(), key=lambda x: x[1], reverse=True)[
-                :10]  # Top 10 senders
-
+        if top_senders:
             senders_table = Table(title="Top Message Senders")
             senders_table.add_column("Sender", style="cyan")
             senders_table.add_column("Messages", style="green")
             senders_table.add_column("Percentage", style="yellow")
 
-            for sender, count in top_senders:
-                senders_table.add_row(sender, str(
-                    count), f"{count/total_messages*100:.1f}%")
+            for sender, count, share in top_senders:
+                senders_table.add_row(sender, str(count), share)
 
             console.print(senders_table)
 
@@ -976,59 +1376,168 @@ class ChatShiftCLI:
         if output_file:
             stats_file = os.path.splitext(output_file)[0] + "_stats.txt"
 
-            with open(stats_file, 'w', encoding='utf-8') as f:
+            with open(stats_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                 f.write(f"Chat Statistics: {dialog.name}\n")
                 f.write(
                     f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
 
                 f.write(f"Total Messages: {total_messages}\n")
-                f.write(
-                    f"Text Messages: {text_messages} ({text_messages/total_messages*100:.1f}%)\n")
-                f.write(
-                    f"Media Messages: {media_messages} ({media_messages/total_messages*100:.1f}%)\n")
-                f.write(
-                    f"Service Messages: {service_messages} ({service_messages/total_messages*100:.1f}%)\n")
-                f.write(
-                    f"Edited Messages: {edited_messages} ({edited_messages/total_messages*100:.1f}%)\n\n")
+                f.write(f"Text Messages: {text_summary}\n")
+                f.write(f"Media Messages: {media_summary}\n")
+                f.write(f"Service Messages: {service_summary}\n")
+                f.write(f"Edited Messages: {edited_summary}\n\n")
 
                 f.write(f"Photos: {photos}\n")
                 f.write(f"Videos: {videos}\n")
                 f.write(f"Documents: {documents}\n")
                 f.write(f"Audio Files: {audio}\n\n")
 
-                f.write(
-                    f"Date Range: {first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')} ({date_range} days)\n")
+                f.write(f"Date Range: {date_range_summary}\n")
                 f.write(f"Messages per Day: {messages_per_day:.1f}\n\n")
 
                 f.write("Top Message Senders:\n")
-                for sender, count in top_senders:
-                    f.write(
-                        f"{sender}: {count} ({count/total_messages*100:.1f}%)\n")
+                for sender, count, share in top_senders:
+                    f.write(f"{sender}: {count} ({share})\n")
 
             console.print(
                 f"\n[success]Statistics exported to:[/success] [cyan]{stats_file}[/cyan]")
 
-        return {
-            'total_messages': total_messages,
-            'text_messages': text_messages,
-            'media_messages': media_messages,
-            'service_messages': service_messages,
-            'edited_messages': edited_messages,
-            'photos': photos,
-            'videos': videos,
-            'documents': documents,
-            'audio': audio,
-            'first_date': first_date,
-            'last_date': last_date,
-            'date_range': date_range,
-            'messages_per_day': messages_per_day,
-            'senders': senders
-        }
+        return stats
+
+    async def fetch_messages(self, dialog, limit, start_date=None, end_date=None,
+                             include_photos=True, include_videos=True, include_documents=True,
+                             include_audio=True, include_stickers=True, include_voice=True,
+                             status=None):
+        """Fetch the messages of a chat that pass the date and media filters, newest first"""
+        # Message dates are aware UTC datetimes, so make the range match once
+        # here and compare them directly below
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+
+        # Whether any media type is excluded
+        filter_media = not (include_photos and include_videos and include_documents and
+                            include_audio and include_stickers and include_voice)
+
+        # Set a reasonable default if limit is 0
+        actual_limit = 5000 if limit == 0 else limit
+
+        # Initialize counters
+        messages = []
+        message_count = 0
+        batch_size = 100  # Messages per progress update
+        last_update = 0.0
+
+        # Mime-type prefixes that are not counted as documents
+        non_document_prefixes = ('video/', 'audio/')
+
+        def keep_mime_type(mime_type):
+            """Decide whether documents of this mime type are exported"""
+            is_voice = mime_type.endswith('ogg')
+
+            # Skip videos if not included
+            if not include_videos and mime_type.startswith('video/'):
+                return False
+
+            # Skip documents if not included
+            if not include_documents and not mime_type.startswith(non_document_prefixes):
+                return False
+
+            # Skip audio if not included
+            if not include_audio and mime_type.startswith('audio/') and not is_voice:
+                return False
+
+            # Skip voice messages if not included
+            if not include_voice and is_voice:
+                return False
+
+            return True
+
+        # The decision only depends on the mime type, and a chat
+        # uses just a handful of them, so each one is decided once
+        mime_type_decisions = {}
+
+        # Define filter function for better performance, picking a simpler
+        # one when every media type is included
+        def dated_message_filter(msg):
+            # Skip messages without date
+            return bool(msg and getattr(msg, 'date', None))
+
+        def media_message_filter(msg):
+            # Skip messages without date
+            if not msg or not getattr(msg, 'date', None):
+                return False
+
+            # Check media type filters, looking each attribute up once
+            media = getattr(msg, 'media', None)
+            if not media:
+                return True
+
+            # Photos only depend on the photo filter
+            if isinstance(media, MessageMediaPhoto):
+                return include_photos
+
+            # Everything else that is filtered is a document
+            document = getattr(media, 'document', None)
+            if document is None:
+                return True
+
+            # Skip stickers if not included
+            if not include_stickers and getattr(msg, 'sticker', None):
+                return False
+
+            # Skip documents whose mime type is excluded
+            mime_type = document.mime_type or ''
+            keep = mime_type_decisions.get(mime_type)
+            if keep is None:
+                keep = mime_type_decisions[mime_type] = keep_mime_type(
+                    mime_type)
+            return keep
+
+        message_filter = media_message_filter if filter_media else dated_message_filter
+
+        # Fetch and filter messages in a single pass. Telethon requests
+        # them in batches of 100 internally; the safety cap stops after
+        # twice the limit, and wait_time=0 avoids its default 1s pause
+        # between batches for large limits. Passing offset_date lets
+        # the server skip everything newer than the end date. The list's
+        # append is hoisted out of the loop.
+        append_message = messages.append
+        async for msg in self.client.iter_messages(dialog.entity, limit=actual_limit * 2,
+                                                   offset_date=end_date, wait_time=0):
+            message_count += 1
+
+            # Messages arrive newest first, so the rest are all too old
+            if start_date and msg.date and msg.date < start_date:
+                break
+
+            # Keep the message if it passes the filters
+            if message_filter(msg):
+                append_message(msg)
+
+                # Check if we've reached the limit
+                if len(messages) >= actual_limit:
+                    break
+
+            # Update progress once per batch, and no more often than
+            # every STATUS_UPDATE_INTERVAL seconds
+            if message_count % batch_size == 0:
+                now = time.monotonic()
+                if status and now - last_update >= STATUS_UPDATE_INTERVAL:
+                    last_update = now
+                    status.update(
+                        f"[bold cyan]Downloaded {message_count} messages...[/bold cyan]")
+
+        # Show completion message
+        if status:
+            status.update(
+                f"[bold green]Downloaded {message_count} messages![/bold green]")
+
+        return messages
 
     async def export_chat(self, dialog, limit, output_file, start_date=None, end_date=None,
                           include_photos=True, include_videos=True, include_documents=True,
                           include_audio=True, include_stickers=True, include_voice=True,
-                          format_template=None, custom_name_info=None, generate_stats=False):
+                          format_template=None, custom_name_info=None, generate_stats=False,
+                          prefetched=None, prefetch_status=None):
         """Export a chat to WhatsApp format"""
         # Create an export panel with details
         export_details = [
@@ -1037,17 +1546,14 @@ class ChatShiftCLI:
             f"[bold]Output File:[/bold] [cyan]{output_file}[/cyan]"
         ]
 
-        # Add date range information if provided
-        if start_date:
-            export_details.append(
-                f"[bold]Start Date:[/bold] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
-        if end_date:
-            export_details.append(
-                f"[bold]End Date:[/bold] [cyan]{(end_date - datetime.timedelta(days=1)).strftime('%Y-%m-%d')}[/cyan]")
+        # Date range and media type lines, shared by the details and success
+        # panels
+        filter_details = self.create_date_range_details(start_date, end_date)
 
         # Add media filtering information
         media_types = []
-        if not (include_photos and include_videos and include_documents and include_audio and include_stickers and include_voice):
+        if not (include_photos and include_videos and include_documents and
+                include_audio and include_stickers and include_voice):
             if include_photos:
                 media_types.append("Photos")
             if include_videos:
@@ -1062,16 +1568,17 @@ class ChatShiftCLI:
                 media_types.append("Voice")
 
             if media_types:
-                export_details.append(
+                filter_details.append(
                     f"[bold]Media Types:[/bold] [cyan]{', '.join(media_types)}[/cyan]")
             else:
-                export_details.append(
+                filter_details.append(
                     f"[bold]Media Types:[/bold] [warning]None (text only)[/warning]")
         else:
-            export_details.append(
+            filter_details.append(
                 f"[bold]Media Types:[/bold] [cyan]All[/cyan]")
 
         # No message type filtering information - all message types are included
+        export_details.extend(filter_details)
 
         export_panel = Panel(
             "\n".join(export_details),
@@ -1081,128 +1588,39 @@ class ChatShiftCLI:
         )
         console.print(export_panel)
 
-        # Set a reasonable default if limit is 0
-        actual_limit = 5000 if limit == 0 else limit
-
         try:
             # Create a progress display
             async with status_context("[bold cyan]Preparing to download messages...[/bold cyan]") as status:
-                # Initialize counters
-                messages = []
-                message_count = 0
-                batch_size = 100  # Process messages in batches for better performance
-
                 # Show progress message
                 status.update("[bold cyan]Downloading messages...[/bold cyan]")
 
-                # Define filter function for better performance
-                def message_filter(msg):
-                    # Skip messages without date
-                    if not msg or not hasattr(msg, 'date') or not msg.date:
-                        return False
-
-                    # Check date filters
-                    if start_date and msg.date < start_date:
-                        return False
-                    if end_date and msg.date > end_date:
-                        return False
-
-                    # Check media type filters
-                    if hasattr(msg, 'media') and msg.media:
-                        # Skip photos if not included
-                        if not include_photos and isinstance(msg.media, MessageMediaPhoto):
-                            return False
-
-                        # Skip videos if not included
-                        if not include_videos and hasattr(msg.media, 'document') and \
-                           hasattr(msg.media.document, 'mime_type') and \
-                           msg.media.document.mime_type and \
-                           msg.media.document.mime_type.startswith('video/'):
-                            return False
-
-                        # Skip documents if not included
-                        if not include_documents and hasattr(msg.media, 'document') and \
-                           not (hasattr(msg.media.document, 'mime_type') and
-                                msg.media.document.mime_type and
-                                (msg.media.document.mime_type.startswith('video/') or
-                                 msg.media.document.mime_type.startswith('audio/'))):
-                            return False
-
-                        # Skip audio if not included
-                        if not include_audio and hasattr(msg.media, 'document') and \
-                           hasattr(msg.media.document, 'mime_type') and \
-                           msg.media.document.mime_type and \
-                           msg.media.document.mime_type.startswith('audio/') and \
-                           not msg.media.document.mime_type.endswith('ogg'):
-                            return False
-
-                        # Skip stickers if not included
-                        if not include_stickers and hasattr(msg, 'sticker') and msg.sticker:
-                            return False
-
-                        # Skip voice messages if not included
-                        if not include_voice and hasattr(msg.media, 'document') and \
-                           hasattr(msg.media.document, 'mime_type') and \
-                           msg.media.document.mime_type and \
-                           msg.media.document.mime_type.endswith('ogg'):
-                            return False
-
-                    # Message passed all filters
-                    return True
-
-                # Process messages in batches for better performance
-                offset_id = 0
-                while True:
-                    # Get a batch of messages
-                    batch = await self.client.get_messages(dialog.entity, limit=batch_size, offset_id=offset_id)
-                    if not batch:
-                        break
-
-                    # Update offset for next batch
-                    offset_id = batch[-1].id
-
-                    # Filter and add messages
-                    filtered_batch = [
-                        msg for msg in batch if message_filter(msg)]
-                    messages.extend(filtered_batch)
-
-                    # Update progress
-                    message_count += len(batch)
-                    status.update(
-                        f"[bold cyan]Downloaded {message_count} messages...[/bold cyan]")
-
-                    # Check if we've reached the limit
-                    if actual_limit > 0 and len(messages) >= actual_limit:
-                        # Trim to exact limit
-                        messages = messages[:actual_limit]
-                        break
-
-                    # Check if we've processed enough messages
-                    if actual_limit > 0 and message_count >= actual_limit * 2:  # Safety check
-                        break
-
-                # Show completion message
-                status.update(
-                    f"[bold green]Downloaded {message_count} messages![/bold green]")
-                time.sleep(0.5)
+                # Use the messages fetched ahead of time if there are any,
+                # showing that fetch's progress while it finishes
+                if prefetched is not None:
+                    if prefetch_status:
+                        prefetch_status.attach(status)
+                    messages = await prefetched
+                else:
+                    messages = await self.fetch_messages(
+                        dialog, limit, start_date, end_date,
+                        include_photos, include_videos, include_documents,
+                        include_audio, include_stickers, include_voice,
+                        status=status)
 
                 # No debug message type counts - removed with message type filtering
 
-                # Format messages using the selected template
-                status.update("[bold cyan]Formatting messages...[/bold cyan]")
-                formatted_messages = await self.format_messages(messages, dialog.name, format_template)
-                time.sleep(0.5)
-
-                # Write to file
-                status.update("[bold cyan]Writing to file...[/bold cyan]")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(formatted_messages))
-                time.sleep(0.5)
+                # Format messages and write them to the file as they are produced
+                status.update(
+                    "[bold cyan]Formatting and writing messages...[/bold cyan]")
+                # Writing runs in a worker thread so the event loop stays
+                # free, letting prefetches of the next chats in a batch
+                # export keep going while this one is written
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.write_messages, messages, dialog.name, format_template, output_file)
 
                 # Show completion message
                 status.update(
                     "[bold green]Export completed successfully![/bold green]")
-                time.sleep(0.5)
 
             # Show success message with details
             success_details = [
@@ -1211,41 +1629,8 @@ class ChatShiftCLI:
                 f"[bold]Output File:[/bold] [cyan]{output_file}[/cyan]"
             ]
 
-            # Add date range information if provided
-            if start_date:
-                success_details.append(
-                    f"[bold]Start Date:[/bold] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
-            if end_date:
-                success_details.append(
-                    f"[bold]End Date:[/bold] [cyan]{(end_date - datetime.timedelta(days=1)).strftime('%Y-%m-%d')}[/cyan]")
-
-            # Add media filtering information
-            media_types = []
-            if not (include_photos and include_videos and include_documents and include_audio and include_stickers and include_voice):
-                if include_photos:
-                    media_types.append("Photos")
-                if include_videos:
-                    media_types.append("Videos")
-                if include_documents:
-                    media_types.append("Documents")
-                if include_audio:
-                    media_types.append("Audio")
-                if include_stickers:
-                    media_types.append("Stickers")
-                if include_voice:
-                    media_types.append("Voice")
-
-                if media_types:
-                    success_details.append(
-                        f"[bold]Media Types:[/bold] [cyan]{', '.join(media_types)}[/cyan]")
-                else:
-                    success_details.append(
-                        f"[bold]Media Types:[/bold] [warning]None (text only)[/warning]")
-            else:
-                success_details.append(
-                    f"[bold]Media Types:[/bold] [cyan]All[/cyan]")
-
-            # No message type filtering information - all message types are included
+            # Add the date range and media filtering information
+            success_details.extend(filter_details)
 
             # Add file naming information if custom naming was used
             if custom_name_info:
@@ -1260,25 +1645,22 @@ class ChatShiftCLI:
             )
             console.print(success_panel)
 
-            # Generate statistics if requested
+            # Generate statistics if requested, otherwise ask if the user
+            # wants them
             if generate_stats:
-                console.print("\n[bold]Generating chat statistics...[/bold]")
-                await self.generate_export_statistics(messages, dialog, output_file)
-
-            # Ask if user wants to generate statistics
-            gen_stats = console.input(
-                "\n[bold]Do you want to generate chat statistics?[/bold] (y/n): ")
+                gen_stats = 'y'
+            else:
+                gen_stats = await self.ask(
+                    "\n[bold]Do you want to generate chat statistics?[/bold] (y/n): ")
             if gen_stats.lower() == 'y':
                 console.print("\n[bold]Generating chat statistics...[/bold]")
                 await self.generate_export_statistics(messages, dialog, output_file)
 
             # Ask if user wants to open the file
-            open_file = console.input(
+            open_file = await self.ask(
                 "\n[bold]Do you want to open the file?[/bold] (y/n): ")
             if open_file.lower() == 'y':
-                async with status_context("[bold cyan]Opening file...[/bold cyan]") as status:
-                    self.open_file(output_file)
-                    time.sleep(0.5)
+                self.open_file(output_file)
 
             return True
         except Exception as e:
@@ -1302,15 +1684,19 @@ class ChatShiftCLI:
             # Different approach based on platform
             system = platform.system()
 
+            # Launch the opener without waiting for it, so a slow-starting
+            # application doesn't hold up the CLI
             if system == 'Windows':
                 # Windows
                 os.startfile(file_path)
             elif system == 'Darwin':
                 # macOS
-                subprocess.call(['open', file_path])
+                subprocess.Popen(['open', file_path], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
             elif system == 'Linux':
                 # Linux
-                subprocess.call(['xdg-open', file_path])
+                subprocess.Popen(['xdg-open', file_path], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
             else:
                 # Unknown OS
                 console.print(
@@ -1322,13 +1708,17 @@ class ChatShiftCLI:
 
     def format_date(self, date, format_template):
         """Format date according to the selected template"""
-        return date.strftime(format_template['date_format'])
+        date_format = format_template['date_format']
 
-    async def format_message(self, message, chat_title=None, format_template=None):
+        # Messages are often sent within the same minute, so the formatted
+        # string is cached by the date truncated to what the format shows
+        return strftime_cached(date_format, date.replace(**date_precision(date_format)))
+
+    def format_message(self, message, chat_title=None, format_template=None):
         """Format a single message according to the selected template"""
         # Use default WhatsApp format if no template is provided
         if not format_template:
-            format_template = FORMAT_TEMPLATES['whatsapp']
+            format_template = DEFAULT_FORMAT_TEMPLATE
 
         # Skip empty messages
         if not message:
@@ -1338,109 +1728,158 @@ class ChatShiftCLI:
             # Get message date
             date_str = self.format_date(message.date, format_template)
 
-            # Get sender name
-            if hasattr(message, 'sender') and message.sender:
-                if hasattr(message.sender, 'first_name') and message.sender.first_name:
-                    sender_name = message.sender.first_name
-                    if hasattr(message.sender, 'last_name') and message.sender.last_name:
-                        sender_name += f" {message.sender.last_name}"
-                elif hasattr(message.sender, 'title') and message.sender.title:
-                    sender_name = message.sender.title
+            # Get sender name, building it once per sender. The cache is
+            # keyed by message.sender_id so later messages from the same
+            # sender don't touch message.sender at all.
+            sender_id = getattr(message, 'sender_id', None)
+            sender_name = self.sender_names.get(sender_id)
+            if sender_name is None:
+                sender = getattr(message, 'sender', None)
+                first_name = getattr(sender, 'first_name', None)
+                if first_name:
+                    sender_name = first_name
+                    last_name = getattr(sender, 'last_name', None)
+                    if last_name:
+                        sender_name += f" {last_name}"
                 else:
-                    sender_name = "Unknown"
-            else:
-                sender_name = "Unknown"
+                    sender_name = getattr(sender, 'title', None) or "Unknown"
+
+                # Only cache names of senders we could identify
+                if sender is not None and sender_id is not None:
+                    self.sender_names[sender_id] = sender_name
 
             # Check if message was edited
             edited_suffix = format_template['edited_suffix'] if message.edit_date else ""
 
-            # Get message content
-            if hasattr(message, 'media') and message.media:
+            # Get message content. Media is checked first since it only needs
+            # the placeholder, and message.text (a property that rebuilds the
+            # text from its entities) is read at most once.
+            media = getattr(message, 'media', None)
+            text = None if media else getattr(message, 'text', None)
+            if media:
                 # Media message
                 content = format_template['media_placeholder']
-            elif hasattr(message, 'text') and message.text:
+            elif text:
                 # Text message
-                content = message.text
-            elif hasattr(message, 'action') and message.action:
-                # Service message (e.g., someone joined the group)
-                action_type = type(message.action).__name__
-                if 'ChatCreate' in action_type:
-                    content = "created this group"
-                elif 'ChatAddUser' in action_type:
-                    content = "added a participant to the group"
-                elif 'ChatDeleteUser' in action_type:
-                    content = "removed a participant from the group"
-                elif 'ChatJoinedByLink' in action_type:
-                    content = "joined the group by link"
-                elif 'ChatEditTitle' in action_type:
-                    content = f"changed the group name to {getattr(message.action, 'title', 'unknown')}"
-                elif 'ChatEditPhoto' in action_type:
-                    content = "changed the group photo"
-                elif 'ChatDeletePhoto' in action_type:
-                    content = "removed the group photo"
-                elif 'MessagePin' in action_type:
-                    content = "pinned a message"
-                else:
-                    content = f"performed action: {action_type}"
+                content = text
             else:
-                # Empty or unknown message type
-                content = format_template['unknown_message_placeholder']
+                action = getattr(message, 'action', None)
+                if action:
+                    # Service message (e.g., someone joined the group)
+                    action_type = type(action).__name__
+                    if action_type == 'MessageActionChatEditTitle':
+                        content = f"changed the group name to {getattr(action, 'title', 'unknown')}"
+                    else:
+                        content = ACTION_DESCRIPTIONS.get(action_type)
+                        if content is None:
+                            content = f"performed action: {action_type}"
+                else:
+                    # Empty or unknown message type
+                    content = format_template['unknown_message_placeholder']
         except Exception:
             content = format_template['error_placeholder']
             edited_suffix = ""
 
         # Format according to the selected template
-        return format_template['message_format'].format(
-            date_str=date_str,
-            sender_name=sender_name,
-            content=content,
-            edited_suffix=edited_suffix
-        )
+        return compile_format(format_template['message_format'])({
+            'date_str': date_str,
+            'sender_name': sender_name,
+            'content': content,
+            'edited_suffix': edited_suffix
+        })
 
     def format_chat_header(self, chat_title, format_template=None):
         """Format chat header according to the selected template"""
         # Use default WhatsApp format if no template is provided
         if not format_template:
-            format_template = FORMAT_TEMPLATES['whatsapp']
+            format_template = DEFAULT_FORMAT_TEMPLATE
 
         today = datetime.datetime.now()
         date_str = self.format_date(today, format_template)
 
-        return format_template['header_format'].format(
-            date_str=date_str,
-            chat_title=chat_title
-        )
-
-    async def format_messages(self, messages, chat_title, format_template=None):
-        """Format a list of messages according to the selected template"""
+        return compile_format(format_template['header_format'])({
+            'date_str': date_str,
+            'chat_title': chat_title
+        })
+
+    def write_messages(self, messages, chat_title, format_template, output_file):
+        """Format messages and write them to output_file as they are produced"""
+        # The file is opened in binary mode and each line is encoded
+        # once here, skipping the text-layer encoder on every write.
+        # Encoded lines are collected in a small bytearray and
+        # written out in chunks rather than two writes per line.
+        # Everything goes to a uniquely named temporary file in the same
+        # directory that replaces the output file only once complete, so a
+        # failed export never leaves a truncated file behind and never
+        # clobbers another file or a concurrent export to the same path.
+        # A symlinked output file is resolved first, so the link is kept
+        # and its target is the file that gets replaced.
+        target = os.path.realpath(output_file)
+        directory, name = os.path.split(target)
+
+        # Unlike mkstemp, creating the file with mode 0o666 lets the umask
+        # give it the permissions a plain open() would
+        while True:
+            temp_file = os.path.join(
+                directory, f"{name}.{os.urandom(4).hex()}.tmp")
+            try:
+                fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL |
+                             getattr(os, 'O_BINARY', 0), 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            with open(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                chunk = bytearray()
+                for line in self.format_messages(messages, chat_title, format_template):
+                    chunk += line.encode('utf-8')
+                    chunk += b'\n'
+                    if len(chunk) >= WRITE_CHUNK_SIZE:
+                        f.write(chunk)
+                        chunk.clear()
+                f.write(chunk)
+
+            # Keep the mode of the file being replaced
+            try:
+                os.chmod(temp_file, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(temp_file, target)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+
+    def format_messages(self, messages, chat_title, format_template=None):
+        """Yield formatted lines for a list of messages, header first"""
         # Use default WhatsApp format if no template is provided
         if not format_template:
-            format_template = FORMAT_TEMPLATES['whatsapp']
+            format_template = DEFAULT_FORMAT_TEMPLATE
 
-        # Initialize the formatted messages list
-        formatted_messages = []
+        # Start with fresh sender names in case they changed since the
+        # last export
+        self.sender_names.clear()
 
-        # Add the header if include_header is True
+        # Yield the header if include_header is True
         if format_template.get('include_header', True):
-            formatted_messages.append(
-                self.format_chat_header(chat_title, format_template))
+            yield self.format_chat_header(chat_title, format_template)
 
-        # Process messages in reverse order (oldest first, like WhatsApp)
+        # Process messages in reverse order (oldest first, like WhatsApp),
+        # with the bound method hoisted out of the loop
+        format_message = self.format_message
         for message in reversed(messages):
             try:
-                formatted = await self.format_message(message, chat_title, format_template)
+                formatted = format_message(message, chat_title, format_template)
                 if formatted:
-                    formatted_messages.append(formatted)
+                    yield formatted
             except Exception as e:
                 logger.error(f"Error formatting message: {str(e)}")
 
-        return formatted_messages
-
     async def run(self):
         """Run the CLI"""
         try:
             # Clear the screen for a clean start
-            os.system('cls' if os.name == 'nt' else 'clear')
+            console.clear()
 
             # Display the logo
             self.display_logo()
@@ -1451,6 +1890,16 @@ class ChatShiftCLI:
                     "\n[danger]Authentication failed. Exiting...[/danger]")
                 return
 
+            # Turn Ctrl+C into a cancellation of this task, so it reaches the
+            # awaited prompt or download below instead of stopping the event
+            # loop. Windows has no loop signal handlers, but Python 3.11+
+            # cancels the task there itself.
+            try:
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGINT, asyncio.current_task().cancel)
+            except (NotImplementedError, RuntimeError):
+                pass
+
             # Main loop
             is_first_run = True
             while True:
@@ -1466,14 +1915,14 @@ class ChatShiftCLI:
                         is_first_run = False
 
                     # Select dialog
-                    selected_dialog = self.select_dialog()
+                    selected_dialog = await self.select_dialog()
 
                     if selected_dialog is None:
                         # User wants to quit
                         break
                     elif selected_dialog == 'refresh':
                         # User wants to refresh - clear screen first to avoid duplicate display
-                        os.system('cls' if os.name == 'nt' else 'clear')
+                        console.clear()
 
                         # Show the logo again
                         self.display_logo()
@@ -1505,7 +1954,7 @@ class ChatShiftCLI:
                     console.print(
                         "[dim]5.[/dim] [cyan]Go back to chat selection[/cyan]")
 
-                    action_choice = console.input(
+                    action_choice = await self.ask(
                         "\n[bold]Enter your choice (1-5):[/bold] ")
 
                     if action_choice == '5':
@@ -1519,7 +1968,7 @@ class ChatShiftCLI:
                             "Select multiple chats to export in batch.")
 
                         # Select multiple dialogs
-                        multiple_dialogs = self.select_dialog(multiple=True)
+                        multiple_dialogs = await self.select_dialog(multiple=True)
 
                         if multiple_dialogs is None:
                             # User wants to quit
@@ -1533,7 +1982,7 @@ class ChatShiftCLI:
                             continue
 
                         # Get export options
-                        options = self.get_export_options()
+                        options = await self.get_export_options()
 
                         # Create output directory
                         output_dir = os.path.join(os.getcwd(), 'exports')
@@ -1557,8 +2006,8 @@ class ChatShiftCLI:
                         )
 
                         # Ask if user wants to continue or exit
-                        continue_choice = console.input(
-                            "\n[bold]Export completed! Continue with ChatShift?[/bold] (y/n, default: n): ").lower()
+                        continue_choice = (await self.ask(
+                            "\n[bold]Export completed! Continue with ChatShift?[/bold] (y/n, default: n): ")).lower()
                         if continue_choice != 'y':
                             # User wants to exit after export
                             break
@@ -1568,26 +2017,22 @@ class ChatShiftCLI:
                     # Get export options if needed
                     options = None
                     if action_choice in ['1', '3']:
-                        options = self.get_export_options()
+                        options = await self.get_export_options()
 
                         # Handle custom file naming if enabled
                         output_file = options['output_file']
                         if options['use_custom_naming'] and options['file_pattern']:
-                            # Replace {chat_name} with the actual chat name
-                            chat_name = selected_dialog.name
-                            # Sanitize chat name for file system
-                            chat_name = ''.join(
-                                c for c in chat_name if c.isalnum() or c in ' _-').strip()
-                            # Replace spaces with underscores
-                            chat_name = chat_name.replace(' ', '_')
+                            # Replace {chat_name} with the sanitized chat name
+                            chat_name = sanitize_chat_name(selected_dialog.name)
 
                             # Apply the pattern
                             output_file = options['file_pattern'].replace(
                                 "{chat_name}", chat_name)
 
                             # Replace date and time placeholders
-                            current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-                            current_time = datetime.datetime.now().strftime("%H%M")
+                            now = datetime.datetime.now()
+                            current_date = now.strftime("%Y-%m-%d")
+                            current_time = now.strftime("%H%M")
                             output_file = output_file.replace(
                                 "{date}", current_date).replace("{time}", current_time)
 
@@ -1621,8 +2066,8 @@ class ChatShiftCLI:
 
                         # If only exporting messages (not downloading media), ask if user wants to continue
                         if action_choice == '1':
-                            continue_choice = console.input(
-                                "\n[bold]Export completed! Continue with ChatShift?[/bold] (y/n, default: n): ").lower()
+                            continue_choice = (await self.ask(
+                                "\n[bold]Export completed! Continue with ChatShift?[/bold] (y/n, default: n): ")).lower()
                             if continue_choice != 'y':
                                 # User wants to exit after export
                                 break
@@ -1632,16 +2077,11 @@ class ChatShiftCLI:
                         # Ask for media download options
                         # Default to a 'media' subdirectory in the current directory
                         default_media_dir = os.path.join(os.getcwd(), 'media')
-                        output_dir = console.input(
-                            f"\n[bold]Enter output directory for media files:[/bold] (default: '{default_media_dir}'): ") or default_media_dir
+                        output_dir = (await self.ask(
+                            f"\n[bold]Enter output directory for media files:[/bold] (default: '{default_media_dir}'): ")) or default_media_dir
 
-                        # Create a subdirectory with the chat name for better organization
-                        chat_name = selected_dialog.name
-                        # Sanitize chat name for file system
-                        chat_name = ''.join(
-                            c for c in chat_name if c.isalnum() or c in ' _-').strip()
-                        # Replace spaces with underscores
-                        chat_name = chat_name.replace(' ', '_')
+                        # Create a subdirectory with the sanitized chat name for better organization
+                        chat_name = sanitize_chat_name(selected_dialog.name)
 
                         # Create a subdirectory for this specific chat
                         output_dir = os.path.join(output_dir, chat_name)
@@ -1649,8 +2089,8 @@ class ChatShiftCLI:
                             f"[dim]→ Media will be saved to:[/dim] [cyan]{output_dir}[/cyan]")
 
                         # Ask for media type filtering
-                        use_media_filter = console.input(
-                            "\n[bold]Filter media types?[/bold] (y/n, default: n): ").lower() == 'y'
+                        use_media_filter = (await self.ask(
+                            "\n[bold]Filter media types?[/bold] (y/n, default: n): ")).lower() == 'y'
 
                         # Default to including all media types
                         include_photos = True
@@ -1669,26 +2109,28 @@ class ChatShiftCLI:
                             )
                             console.print(media_panel)
 
-                            # Ask for each media type
-                            include_photos = console.input(
-                                "\n[bold]Include photos?[/bold] (y/n, default: y): ").lower() != 'n'
-                            include_videos = console.input(
-                                "[bold]Include videos?[/bold] (y/n, default: y): ").lower() != 'n'
-                            include_documents = console.input(
-                                "[bold]Include documents?[/bold] (y/n, default: y): ").lower() != 'n'
-                            include_stickers = console.input(
-                                "[bold]Include stickers?[/bold] (y/n, default: y): ").lower() != 'n'
+                            # Ask for all media types at once, with validation
+                            while True:
+                                try:
+                                    media_types = parse_media_types(await self.ask(
+                                        "\n[bold]Media types to include[/bold] (comma-separated: photos, "
+                                        "videos, documents, stickers; default: all): "),
+                                        ('photos', 'videos', 'documents', 'stickers'))
+                                    break
+                                except ValueError as e:
+                                    console.print(
+                                        f"[bold yellow]{escape(str(e))}. Please enter types from the list.[/bold yellow]")
+                            include_photos = 'photos' in media_types
+                            include_videos = 'videos' in media_types
+                            include_documents = 'documents' in media_types
+                            include_stickers = 'stickers' in media_types
 
                             # Show summary of selected options
                             console.print(
-                                "\n[bold]Media types to include:[/bold]")
-                            console.print(
-                                f"[dim]→ Photos:[/dim] [cyan]{'Yes' if include_photos else 'No'}[/cyan]")
-                            console.print(
-                                f"[dim]→ Videos:[/dim] [cyan]{'Yes' if include_videos else 'No'}[/cyan]")
-                            console.print(
-                                f"[dim]→ Documents:[/dim] [cyan]{'Yes' if include_documents else 'No'}[/cyan]")
-                            console.print(
+                                "\n[bold]Media types to include:[/bold]\n"
+                                f"[dim]→ Photos:[/dim] [cyan]{'Yes' if include_photos else 'No'}[/cyan]\n"
+                                f"[dim]→ Videos:[/dim] [cyan]{'Yes' if include_videos else 'No'}[/cyan]\n"
+                                f"[dim]→ Documents:[/dim] [cyan]{'Yes' if include_documents else 'No'}[/cyan]\n"
                                 f"[dim]→ Stickers:[/dim] [cyan]{'Yes' if include_stickers else 'No'}[/cyan]")
 
                         # Use the same date range as the export if available
@@ -1710,21 +2152,21 @@ class ChatShiftCLI:
 
                         # If only downloading media (not exporting messages), ask if user wants to continue
                         if action_choice == '2':
-                            continue_choice = console.input(
-                                "\n[bold]Media download completed! Continue with ChatShift?[/bold] (y/n, default: n): ").lower()
+                            continue_choice = (await self.ask(
+                                "\n[bold]Media download completed! Continue with ChatShift?[/bold] (y/n, default: n): ")).lower()
                             if continue_choice != 'y':
                                 # User wants to exit after download
                                 break
 
                     # Ask if user wants to export another chat
-                    another = console.input(
+                    another = await self.ask(
                         "\n[bold]Do you want to process another chat?[/bold] (y/n): ")
                     if another.lower() != 'y':
                         break
                     else:
                         # User wants to process another chat, refresh the dialog list
                         # Clear the screen first to avoid duplicate display
-                        os.system('cls' if os.name == 'nt' else 'clear')
+                        console.clear()
 
                         # Show the logo again
                         self.display_logo()
@@ -1737,10 +2179,16 @@ class ChatShiftCLI:
 
                         # No need to call display_dialogs() as get_dialogs() already displays the list when is_refresh=True
 
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    # Ctrl+C cancelled this task, take that back so the loop
+                    # can go on (uncancel() exists from Python 3.11)
+                    task = asyncio.current_task()
+                    if hasattr(task, 'uncancel'):
+                        task.uncancel()
+
                     # Handle Ctrl+C gracefully with a clean panel
                     # Clear the screen for a clean display
-                    os.system('cls' if os.name == 'nt' else 'clear')
+                    console.clear()
 
                     # Show the logo again
                     self.display_logo()
@@ -1772,14 +2220,14 @@ class ChatShiftCLI:
 
                     # Ask if user wants to continue with the program
                     try:
-                        continue_program = console.input(
+                        continue_program = await self.ask(
                             "\n[bold]Continue?[/bold] (y/n): ")
                         if continue_program.lower() != 'y':
                             break
                         else:
                             # User wants to continue, refresh the dialog list
                             # Clear the screen first to avoid duplicate display
-                            os.system('cls' if os.name == 'nt' else 'clear')
+                            console.clear()
 
                             # Show the logo again
                             self.display_logo()
@@ -1791,10 +2239,10 @@ class ChatShiftCLI:
                                 break
 
                             # No need to call display_dialogs() as get_dialogs() already displays the list when is_refresh=True
-                    except KeyboardInterrupt:
+                    except (KeyboardInterrupt, asyncio.CancelledError):
                         # If user presses Ctrl+C again, exit with a clean panel
                         # Clear the screen for a clean exit
-                        os.system('cls' if os.name == 'nt' else 'clear')
+                        console.clear()
 
                         # Create a stylish exit message
                         exit_text = Text()
@@ -1829,13 +2277,11 @@ class ChatShiftCLI:
             if self.client:
                 async with status_context("[info]Disconnecting from Telegram...[/info]") as status:
                     await self.client.disconnect()
-                    time.sleep(0.5)
                     status.update("[success]Disconnected![/success]")
-                    time.sleep(0.5)
 
             # Farewell message - create a more elegant and visually appealing goodbye
             # Clear the screen for a clean exit
-            os.system('cls' if os.name == 'nt' else 'clear')
+            console.clear()
 
             # Create a stylish farewell message
             farewell_text = Text()
@@ -1865,10 +2311,11 @@ class ChatShiftCLI:
             console.print(Align.center(farewell_panel))
             console.print("\n")
 
-        except KeyboardInterrupt:
-            # Handle Ctrl+C at the top level with a more elegant exit
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Handle Ctrl+C at the top level with a more elegant exit. Ctrl+C
+            # arrives as a cancellation of the main task.
             # Clear the screen for a clean exit
-            os.system('cls' if os.name == 'nt' else 'clear')
+            console.clear()
 
             # Create a stylish exit message
             exit_text = Text()
@@ -1907,7 +2354,7 @@ class ChatShiftCLI:
         except Exception as e:
             # Handle any other exceptions with a cleaner error message
             # Clear the screen for a clean display
-            os.system('cls' if os.name == 'nt' else 'clear')
+            console.clear()
 
             # Create a stylish error message
             error_text = Text()
@@ -1940,6 +2387,10 @@ class ChatShiftCLI:
                 except Exception:
                     pass
 
+        finally:
+            # Don't leave a prompt reader behind
+            self.close_input()
+
     async def export_multiple_chats(self, dialogs, limit, output_dir, start_date=None, end_date=None,
                                     include_photos=True, include_videos=True, include_documents=True,
                                     include_audio=True, include_stickers=True, include_voice=True,
@@ -1977,82 +2428,115 @@ class ChatShiftCLI:
         )
         console.print(export_panel)
 
-        # Process each dialog
-        for i, dialog in enumerate(dialogs, 1):
-            try:
-                # Create a filename for this chat
-                chat_name = dialog.name
-                # Sanitize chat name for file system
-                chat_name = ''.join(
-                    c for c in chat_name if c.isalnum() or c in ' _-').strip()
-                # Replace spaces with underscores
-                chat_name = chat_name.replace(' ', '_')
-
-                # Generate output file path
-                if custom_name_info:
-                    # Apply the pattern
-                    file_name = custom_name_info['pattern'].replace(
-                        "{chat_name}", chat_name)
-
-                    # Replace date and time placeholders
-                    current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-                    current_time = datetime.datetime.now().strftime("%H%M")
-                    file_name = file_name.replace(
-                        "{date}", current_date).replace("{time}", current_time)
-
-                    # Add file extension
-                    file_name += custom_name_info['extension']
-                else:
-                    # Default filename
-                    file_name = f"{chat_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.txt"
+        # Each export waits on prompts, so the messages of the next few chats
+        # are fetched in the background meanwhile
+        fetches = {}
+        fetch_statuses = {}
+
+        def prefetch(index):
+            if index < len(dialogs) and index not in fetches:
+                fetch_statuses[index] = StatusRelay()
+                fetches[index] = asyncio.create_task(self.fetch_messages(
+                    dialogs[index], limit, start_date, end_date,
+                    include_photos, include_videos, include_documents,
+                    include_audio, include_stickers, include_voice,
+                    status=fetch_statuses[index]))
+
+        async def discard(tasks):
+            # Cancel fetches that are no longer needed and collect their
+            # results, so none keeps running or leaves an exception unread
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Date and time used in the file names, taken once so every file of
+        # this batch gets the same stamp
+        now = datetime.datetime.now()
+        current_date = now.strftime("%Y-%m-%d")
+        current_time = now.strftime("%H%M")
+        default_stamp = now.strftime('%Y%m%d_%H%M')
+
+        # Process each dialog. Fetches still pending when the loop ends,
+        # whether normally or through an exception, are discarded.
+        try:
+            for i, dialog in enumerate(dialogs, 1):
+                for index in range(i - 1, i + CHAT_PREFETCH_COUNT):
+                    prefetch(index)
 
-                output_file = os.path.join(output_dir, file_name)
+                try:
+                    # Create a filename for this chat from its sanitized name
+                    chat_name = sanitize_chat_name(dialog.name)
 
-                # Show progress
-                console.print(
-                    f"\n[bold][{i}/{len(dialogs)}] Exporting:[/bold] [cyan]{dialog.name}[/cyan]")
-
-                # Export the chat
-                await self.export_chat(
-                    dialog,
-                    limit,
-                    output_file,
-                    start_date,
-                    end_date,
-                    include_photos,
-                    include_videos,
-                    include_documents,
-                    include_audio,
-                    include_stickers,
-                    include_voice,
-                    format_template,
-                    custom_name_info
-                )
-
-                successful_exports.append((dialog.name, output_file))
+                    # Generate output file path
+                    if custom_name_info:
+                        # Apply the pattern
+                        file_name = custom_name_info['pattern'].replace(
+                            "{chat_name}", chat_name)
 
-            except Exception as e:
-                logger.error(f"Error exporting chat {dialog.name}: {str(e)}")
-                failed_exports.append((dialog.name, str(e)))
-                console.print(
-                    f"[danger]Error exporting {dialog.name}: {str(e)}[/danger]")
+                        # Replace date and time placeholders
+                        file_name = file_name.replace(
+                            "{date}", current_date).replace("{time}", current_time)
+
+                        # Add file extension
+                        file_name += custom_name_info['extension']
+                    else:
+                        # Default filename
+                        file_name = f"{chat_name}_{default_stamp}.txt"
+
+                    output_file = os.path.join(output_dir, file_name)
+
+                    # Show progress
+                    console.print(
+                        f"\n[bold][{i}/{len(dialogs)}] Exporting:[/bold] [cyan]{dialog.name}[/cyan]")
+
+                    # Export the chat
+                    await self.export_chat(
+                        dialog,
+                        limit,
+                        output_file,
+                        start_date,
+                        end_date,
+                        include_photos,
+                        include_videos,
+                        include_documents,
+                        include_audio,
+                        include_stickers,
+                        include_voice,
+                        format_template,
+                        custom_name_info,
+                        prefetched=fetches[i - 1],
+                        prefetch_status=fetch_statuses[i - 1]
+                    )
+
+                    successful_exports.append((dialog.name, output_file))
+
+                except Exception as e:
+                    logger.error(f"Error exporting chat {dialog.name}: {str(e)}")
+                    failed_exports.append((dialog.name, str(e)))
+                    console.print(
+                        f"[danger]Error exporting {dialog.name}: {str(e)}[/danger]")
+
+                # This chat's fetch is finished with, whether it was used or not
+                await discard([fetches.pop(i - 1)])
+                del fetch_statuses[i - 1]
+        finally:
+            await discard(list(fetches.values()))
 
         # Show summary
         console.print("\n[bold]Export Summary:[/bold]")
         console.print(
             f"[success]Successfully exported:[/success] [cyan]{len(successful_exports)}/{len(dialogs)}[/cyan]")
 
+        # Print each list with a single call instead of one per chat
         if successful_exports:
-            console.print("\n[bold]Successful exports:[/bold]")
-            for name, path in successful_exports:
-                console.print(
-                    f"  [dim]•[/dim] [cyan]{name}[/cyan] → [dim]{path}[/dim]")
+            console.print("\n[bold]Successful exports:[/bold]\n" + "\n".join(
+                f"  [dim]•[/dim] [cyan]{name}[/cyan] → [dim]{path}[/dim]"
+                for name, path in successful_exports))
 
         if failed_exports:
-            console.print("\n[bold]Failed exports:[/bold]")
-            for name, error in failed_exports:
-                console.print(
-                    f"  [dim]•[/dim] [danger]{name}[/danger] → [dim]{error}[/dim]")
+            console.print("\n[bold]Failed exports:[/bold]\n" + "\n".join(
+                f"  [dim]•[/dim] [danger]{name}[/danger] → [dim]{error}[/dim]"
+                for name, error in failed_exports))
 
         return output_dir
 
@@ -2060,6 +2544,10 @@ class ChatShiftCLI:
                              include_photos=True, include_videos=True, include_documents=True,
                              include_stickers=True):
         """Download media files from a chat"""
+        # Message dates are aware UTC datetimes, so make the range match once
+        # here and compare them directly below
+        start_date, end_date = as_utc(start_date), as_utc(end_date)
+
         # Create an export panel with details
         export_details = [
             f"[bold]Downloading Media from:[/bold] [cyan]{dialog.name}[/cyan]",
@@ -2068,12 +2556,8 @@ class ChatShiftCLI:
         ]
 
         # Add date range information if provided
-        if start_date:
-            export_details.append(
-                f"[bold]Start Date:[/bold] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
-        if end_date:
-            export_details.append(
-                f"[bold]End Date:[/bold] [cyan]{(end_date - datetime.timedelta(days=1)).strftime('%Y-%m-%d')}[/cyan]")
+        export_details.extend(
+            self.create_date_range_details(start_date, end_date))
 
         # Add media type information
         media_types = []
@@ -2113,110 +2597,162 @@ class ChatShiftCLI:
             # Get messages
             message_count = 0
             media_count = 0
-            batch_size = 100  # Process messages in batches for better performance
+            batch_size = 100  # Messages per progress update
 
-            # Define filter function for better performance
-            def media_filter(msg):
-                # Apply date filter if provided
-                if start_date and msg.date.replace(tzinfo=None) < start_date:
+            # Mime-type prefixes that are not counted as documents
+            non_document_prefixes = ('image/', 'video/', 'audio/')
+
+            def keep_mime_type(mime_type):
+                # Documents without a mime type are always kept
+                if not mime_type:
+                    return True
+
+                # Skip videos if not included
+                if not include_videos and mime_type.startswith('video/'):
                     return False
-                if end_date and msg.date.replace(tzinfo=None) >= end_date:
+
+                # Skip documents if not included
+                if not include_documents and not mime_type.startswith(non_document_prefixes):
                     return False
 
+                return True
+
+            # Each mime type is decided once per download run
+            mime_type_decisions = {}
+
+            # Define filter function for better performance
+            def media_filter(msg):
                 # Check if message has media
-                if not msg.media:
+                media = msg.media
+                if not media:
                     return False
 
-                # Skip media types that are not included
-                if hasattr(msg.media, 'photo') and msg.media.photo and not include_photos:
-                    return False
+                # Photos only depend on the photo filter
+                if isinstance(media, MessageMediaPhoto):
+                    return include_photos
 
-                if hasattr(msg.media, 'document') and msg.media.document:
-                    # Check document type
-                    if hasattr(msg.media.document, 'mime_type') and msg.media.document.mime_type:
-                        mime_type = msg.media.document.mime_type
+                # Everything else that is filtered is a document
+                document = getattr(media, 'document', None)
+                if not document:
+                    return True
 
-                        # Skip videos if not included
-                        if mime_type.startswith('video/') and not include_videos:
-                            return False
+                # Skip stickers if not included
+                if not include_stickers and getattr(msg, 'sticker', None):
+                    return False
 
-                        # Skip documents if not included
-                        if not (mime_type.startswith('image/') or
-                                mime_type.startswith('video/') or
-                                mime_type.startswith('audio/')) and not include_documents:
-                            return False
+                # Skip documents whose mime type is excluded
+                mime_type = getattr(document, 'mime_type', None) or ''
+                keep = mime_type_decisions.get(mime_type)
+                if keep is None:
+                    keep = mime_type_decisions[mime_type] = keep_mime_type(
+                        mime_type)
+                return keep
+
+            # Download media files in parallel, with at most
+            # MEDIA_DOWNLOAD_CONCURRENCY files in flight at once. Finished
+            # tasks remove themselves from the set.
+            download_semaphore = asyncio.Semaphore(MEDIA_DOWNLOAD_CONCURRENCY)
+            download_tasks = set()
+
+            # Names already in the output directory or claimed by this run.
+            # Checking this set also catches clashes between downloads that
+            # haven't been written to disk yet. Names are compared casefolded,
+            # since "Photo.jpg" and "photo.jpg" are the same file on Windows
+            # and macOS.
+            used_filenames = {name.casefold() for name in os.listdir(output_dir)}
+
+            # Progress is reported both per batch and per finished download,
+            # so throttle redraws to every STATUS_UPDATE_INTERVAL seconds
+            last_update = 0.0
+
+            def update_progress():
+                nonlocal last_update
+                now = time.monotonic()
+                if now - last_update >= STATUS_UPDATE_INTERVAL:
+                    last_update = now
+                    status.update(
+                        f"[bold cyan]Processed {message_count} messages, downloaded {media_count} media files...[/bold cyan]")
+
+            async def download_file(message, file_path):
+                nonlocal media_count
+                async with download_semaphore:
+                    try:
+                        await message.download_media(file=file_path)
+                    except Exception as e:
+                        console.print(
+                            f"[bold red]Error downloading media:[/bold red] {str(e)}")
+                        return
 
-                    # Skip stickers if not included
-                    if hasattr(msg, 'sticker') and msg.sticker and not include_stickers:
-                        return False
+                media_count += 1
+                update_progress()
 
-                # Message passed all filters
-                return True
+            # Process messages as Telethon fetches them in batches. Passing
+            # offset_date lets the server skip everything newer than the end
+            # date instead of sending it only to be discarded here.
+            try:
+                async for message in self.client.iter_messages(dialog.entity, limit=limit or None,
+                                                               offset_date=end_date, wait_time=0):
+                    message_count += 1
 
-            # Process messages in batches for better performance
-            offset_id = 0
-            while True:
-                # Get a batch of messages
-                batch = await self.client.get_messages(dialog.entity, limit=batch_size, offset_id=offset_id)
-                if not batch:
-                    break
+                    # Messages arrive newest first, so the rest are all too old
+                    if start_date and message.date < start_date:
+                        break
 
-                # Update offset for next batch
-                offset_id = batch[-1].id
+                    # Update progress once per batch
+                    if message_count % batch_size == 0:
+                        update_progress()
 
-                # Filter messages with media
-                media_messages = [msg for msg in batch if media_filter(msg)]
+                    # Skip messages without wanted media
+                    if not media_filter(message):
+                        continue
 
-                # Download media files in parallel for better performance
-                download_tasks = []
-                for message in media_messages:
+                    # Start the download in the background so fetching can
+                    # continue while files are still downloading
                     try:
                         filename = f"{message.id}"
-                        if hasattr(message.media, 'document') and message.media.document and hasattr(message.media.document, 'attributes'):
-                            for attr in message.media.document.attributes:
-                                if hasattr(attr, 'file_name') and attr.file_name:
-                                    filename = attr.file_name
-                                    break
+                        document = getattr(message.media, 'document', None)
+                        for attr in getattr(document, 'attributes', None) or ():
+                            file_name = getattr(attr, 'file_name', None)
+                            if file_name:
+                                filename = file_name
+                                break
 
                         # Ensure filename is unique
-                        file_path = os.path.join(output_dir, filename)
-                        if os.path.exists(file_path):
+                        if filename.casefold() in used_filenames:
                             base, ext = os.path.splitext(filename)
                             filename = f"{base}_{message.id}{ext}"
-                            file_path = os.path.join(output_dir, filename)
+                        used_filenames.add(filename.casefold())
+                        file_path = os.path.join(output_dir, filename)
+
+                        # Once enough downloads are waiting, let one finish
+                        # before fetching further, so a long chat doesn't pile
+                        # up thousands of pending tasks and messages
+                        if len(download_tasks) >= MEDIA_DOWNLOAD_BACKLOG:
+                            await asyncio.wait(download_tasks, return_when=asyncio.FIRST_COMPLETED)
 
                         # Add download task
-                        download_tasks.append(
-                            message.download_media(file=file_path))
+                        task = asyncio.create_task(
+                            download_file(message, file_path))
+                        download_tasks.add(task)
+                        task.add_done_callback(download_tasks.discard)
                     except Exception as e:
                         console.print(
                             f"[bold red]Error preparing media download:[/bold red] {str(e)}")
 
-                # Execute downloads in parallel
-                if download_tasks:
-                    try:
-                        # Use asyncio.gather for parallel downloads
-                        await asyncio.gather(*download_tasks)
-                        media_count += len(download_tasks)
-                        status.update(
-                            f"[bold cyan]Downloaded {media_count} media files...[/bold cyan]")
-                    except Exception as e:
-                        console.print(
-                            f"[bold red]Error downloading media:[/bold red] {str(e)}")
-
-                # Update message count
-                message_count += len(batch)
-                status.update(
-                    f"[bold cyan]Processed {message_count} messages, downloaded {media_count} media files...[/bold cyan]")
-
-                # Check if we've reached the limit
-                if limit > 0 and message_count >= limit:
-                    break
+                # Wait for the remaining downloads to finish
+                await asyncio.gather(*download_tasks)
+            finally:
+                # If fetching failed or was cancelled, stop the downloads
+                # still running and collect their results, so none keeps
+                # writing into the output directory
+                pending = list(download_tasks)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
             # Show completion message
             status.update(
                 f"[bold green]Downloaded {media_count} media files from {message_count} messages![/bold green]")
-            time.sleep(0.5)
 
         # Show success message with details
         success_details = [
@@ -2227,12 +2763,8 @@ class ChatShiftCLI:
         ]
 
         # Add date range information if provided
-        if start_date:
-            success_details.append(
-                f"[bold]Start Date:[/bold] [cyan]{start_date.strftime('%Y-%m-%d')}[/cyan]")
-        if end_date:
-            success_details.append(
-                f"[bold]End Date:[/bold] [cyan]{(end_date - datetime.timedelta(days=1)).strftime('%Y-%m-%d')}[/cyan]")
+        success_details.extend(
+            self.create_date_range_details(start_date, end_date))
 
         # Add media type information
         if media_types:
@@ -2250,9 +2782,14 @@ class ChatShiftCLI:
 
 async def main():
     """Main function"""
+    configure_logging()
     cli = ChatShiftCLI()
     await cli.run()
 
 if __name__ == "__main__":
-    # Run the CLI
-    asyncio.run(main())
+    # Run the CLI. Before Python 3.11, Ctrl+C during sign-in or on Windows is
+    # raised here once run() has shown its goodbye and disconnected.
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass